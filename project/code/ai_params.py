@@ -0,0 +1,115 @@
+"""Модуль с настраиваемыми параметрами ИИ."""
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class AIParams:
+    """Класс для хранения параметров стратегии ИИ."""
+
+    # Файл с лучшими параметрами (создается tuner.py)
+    DEFAULT_FILE = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "ai_params.json"
+    )
+
+    # Допустимые правила смены направления после промаха
+    MISS_POLICIES = ("rotate", "reverse")
+
+    _cache: Dict[str, "AIParams"] = {}
+
+    def __init__(
+        self,
+        directions: Optional[List[Tuple[int, int]]] = None,
+        miss_policy: str = "rotate",
+        parity_weight: float = 1.0,
+        prior_floor: float = 0.1,
+        endgame_limit: int = 25
+    ) -> None:
+        """
+        Инициализация параметров (по умолчанию - исходная стратегия).
+
+        Args:
+            directions: Порядок направлений добивания корабля
+            miss_policy: "rotate" - следующее направление после промаха,
+                "reverse" - противоположное
+            parity_weight: Вес клеток с четной суммой координат при поиске
+                (1 - равномерный поиск)
+            prior_floor: Минимальный вес клетки при поиске по модели
+                расстановок противника
+            endgame_limit: Порог числа расстановок для точного эндшпиля
+                (0 - эндшпиль отключен)
+        """
+        self.directions = directions or [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        self.miss_policy = miss_policy
+        self.parity_weight = parity_weight
+        self.prior_floor = prior_floor
+        self.endgame_limit = endgame_limit
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Параметры в виде словаря для JSON.
+
+        Returns:
+            Dict[str, Any]: Словарь параметров
+        """
+        return {
+            "directions": [list(direction) for direction in self.directions],
+            "miss_policy": self.miss_policy,
+            "parity_weight": self.parity_weight,
+            "prior_floor": self.prior_floor,
+            "endgame_limit": self.endgame_limit,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AIParams":
+        """
+        Параметры из словаря (отсутствующие ключи берутся по умолчанию).
+
+        Args:
+            data: Словарь параметров
+
+        Returns:
+            AIParams: Параметры
+        """
+        params = cls()
+        if "directions" in data:
+            params.directions = [tuple(direction)
+                                 for direction in data["directions"]]
+        if data.get("miss_policy") in cls.MISS_POLICIES:
+            params.miss_policy = data["miss_policy"]
+        params.parity_weight = float(data.get("parity_weight",
+                                              params.parity_weight))
+        params.prior_floor = float(data.get("prior_floor",
+                                            params.prior_floor))
+        params.endgame_limit = int(data.get("endgame_limit",
+                                            params.endgame_limit))
+        return params
+
+    def save(self, path: str) -> None:
+        """
+        Сохранение параметров в JSON.
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "AIParams":
+        """
+        Загрузка параметров (файл читается один раз за запуск).
+
+        Args:
+            path: Путь к файлу (None - файл по умолчанию)
+
+        Returns:
+            AIParams: Параметры из файла или по умолчанию, если файла нет
+        """
+        path = path or cls.DEFAULT_FILE
+        if path not in cls._cache:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    cls._cache[path] = cls.from_dict(json.load(file))
+            else:
+                cls._cache[path] = cls()
+        return cls._cache[path]
@@ -1,11 +1,22 @@
 """Модуль для управления ИИ противника."""
 import random
-from typing import Tuple, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
+from ai_params import (
+    AIParams,
+    )
 from board import (
     Board,
+    BoardView,
+    )
+from endgame import (
+    EndgameSolver,
+    )
+from placement_model import (
+    PlacementModel,
     )
 from ship_placer import (
+    Layout,
     ShipPlacer,
     )
 from player import (
@@ -16,17 +27,45 @@ from player import (
 class AIPlayer(Player):
     """Класс для управления ИИ противника."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        layouts: Optional[List[Layout]] = None,
+        model_path: Optional[str] = None,
+        board_size: int = 6,
+        params: Optional[AIParams] = None,
+        rng: Optional[random.Random] = None
+    ) -> None:
         """
         Инициализация ИИ.
+
+        Args:
+            layouts: Библиотека сложных расстановок (режим "сложный")
+            model_path: Файл модели расстановок противника (None - без нее)
+            board_size: Размер доски противника
+            params: Параметры стратегии (None - из AIParams.DEFAULT_FILE)
+            rng: Генератор случайных чисел (None - новый, без зерна)
         """
         super().__init__("Компьютер")
-        self.last_hit: Optional[Tuple[int, int]] = None
-        self.directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        self.params = params or AIParams.load()
+        self.rng = rng or random.Random()
+        self.layouts = layouts or []
+        self.model_path = model_path
+        self.model: Optional[PlacementModel] = None
+        if model_path:
+            self.model = PlacementModel.load(model_path, board_size)
+        self.directions = list(self.params.directions)
         self.current_direction = 0
         self.hits_history: list[Tuple[int, int]] = []
+        self.misses_history: list[Tuple[int, int]] = []
+        self.endgame: Optional[EndgameSolver] = None
+        # Необстрелянные клетки, где еще может стоять корабль
+        self.candidates: Set[Tuple[int, int]] = set()
+        self.board_size = 0
+        # Подбитые, но еще не потопленные корабли (ряды попаданий)
+        self.clusters: List[List[Tuple[int, int]]] = []
+        self.remaining_ships = list(ShipPlacer.DEFAULT_SHIPS)
 
-    def make_shot(self, enemy_board: Board) -> Tuple[int, int]:
+    def make_shot(self, enemy_board: BoardView) -> Tuple[int, int]:
         """
         Выбор координат для выстрела ИИ.
 
@@ -36,16 +75,49 @@ class AIPlayer(Player):
         Returns:
             Tuple[int, int]: Координаты (строка, столбец) для выстрела
         """
-        # Если был попадание, пытаемся добить корабль
-        if self.last_hit:
-            targeted_shot = self._make_targeted_shot(enemy_board)
-            if targeted_shot:
-                return targeted_shot
+        if self.board_size != enemy_board.size:
+            self.board_size = enemy_board.size
+            self.candidates = set(enemy_board.get_empty_cells())
+
+        # В эндшпиле выбираем выстрел точным перебором
+        endgame_shot = self._make_endgame_shot(enemy_board)
+        if endgame_shot:
+            return endgame_shot
+
+        # Если есть подбитый корабль, добиваем его
+        targeted_shot = self._make_targeted_shot()
+        if targeted_shot:
+            return targeted_shot
 
         # Иначе стреляем случайно
         return self._make_random_shot(enemy_board)
 
-    def _make_random_shot(self, enemy_board: Board) -> Tuple[int, int]:
+    def _make_endgame_shot(
+        self,
+        enemy_board: BoardView
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Точный выстрел, когда вариантов расстановки осталось мало.
+
+        Args:
+            enemy_board: Доска противника
+
+        Returns:
+            Optional[Tuple[int, int]]: Координаты или None, если решатель
+            не включился или не уложился в бюджет
+        """
+        if self.params.endgame_limit <= 0:
+            return None
+
+        if self.endgame is None or self.endgame.size != enemy_board.size:
+            self.endgame = EndgameSolver(enemy_board.size,
+                                         ShipPlacer.DEFAULT_SHIPS,
+                                         self.params.endgame_limit)
+
+        # Клетки вне candidates заведомо пусты (промахи и ореолы)
+        return self.endgame.choose_shot(self.hits_history, self.candidates)
+
+    def _make_random_shot(self, enemy_board: BoardView) -> Tuple[int, int]:
         """
         Случайный выстрел.
 
@@ -55,51 +127,129 @@ class AIPlayer(Player):
         Returns:
             Tuple[int, int]: Случайные координаты
         """
-        empty_cells = enemy_board.get_empty_cells()
+        empty_cells = self._hunt_cells() or enemy_board.get_empty_cells()
 
         if empty_cells:
-            return random.choice(empty_cells)
+            weights = self._hunt_weights(empty_cells, enemy_board.size)
+            if weights:
+                return self.rng.choices(empty_cells, weights=weights)[0]
+            return self.rng.choice(empty_cells)
 
         # Если все клетки обстреляны (крайний случай)
         return (0, 0)
 
-    def _make_targeted_shot(self, enemy_board: Board) -> Optional[Tuple[int, int]]:
+    def _hunt_cells(self) -> List[Tuple[int, int]]:
+        """
+        Клетки для поиска, куда помещается хотя бы самый малый корабль.
+
+        Returns:
+            List[Tuple[int, int]]: Клетки-кандидаты
+        """
+        smallest = min(self.remaining_ships, default=1)
+        if smallest <= 1:
+            return sorted(self.candidates)
+        return sorted(cell for cell in self.candidates
+                      if self._fits(cell, smallest))
+
+    def _fits(self, cell: Tuple[int, int], length: int) -> bool:
         """
-        Целевой выстрел вокруг попадания.
+        Проверка, помещается ли через клетку корабль заданной длины.
 
         Args:
-            enemy_board: Доска противника
+            cell: Клетка
+            length: Длина корабля
 
         Returns:
-            Optional[Tuple[int, int]]: Координаты для выстрела или None
+            bool: True если по горизонтали или вертикали хватает кандидатов
         """
-        if not self.last_hit:
-            return None
+        row, col = cell
+        for delta_row, delta_col in [(0, 1), (1, 0)]:
+            run = 1
+            for sign in (1, -1):
+                step = 1
+                while (row + sign * step * delta_row,
+                       col + sign * step * delta_col) in self.candidates:
+                    run += 1
+                    step += 1
+            if run >= length:
+                return True
+        return False
 
-        row, col = self.last_hit
+    def _hunt_weights(
+        self,
+        cells: List[Tuple[int, int]],
+        board_size: int
+    ) -> Optional[List[float]]:
+        """
+        Веса клеток для случайного поиска кораблей.
 
-        # Пробуем все направления вокруг попадания
-        for _ in range(len(self.directions)):
-            delta_row, delta_col = self.directions[self.current_direction]
-            target_row = row + delta_row
-            target_col = col + delta_col
-
-            if (0 <= target_row < enemy_board.size and
-                    0 <= target_col < enemy_board.size and
-                    enemy_board.grid[target_row][target_col] not in 
-                    [Board.HIT, Board.MISS]):
-                return (target_row, target_col)
-
-            # Меняем направление для следующей попытки
-            self.current_direction = (self.current_direction + 1) % len(
-                self.directions
-            )
-
-        # Если не нашли подходящую цель, сбрасываем
-        self.last_hit = None
-        self.current_direction = 0
+        Args:
+            cells: Необстрелянные клетки
+            board_size: Размер доски противника
+
+        Returns:
+            Optional[List[float]]: Веса или None для равномерного выбора
+        """
+        weights = None
+
+        # Если знаем привычки противника, чаще стреляем туда, где он
+        # обычно ставит корабли
+        if (self.model and self.model.mass and
+                self.model.size == board_size):
+            weights = self.model.hunt_weights(cells, self.params.prior_floor)
+
+        if self.params.parity_weight != 1.0:
+            weights = weights or [1.0] * len(cells)
+            weights = [
+                weight * (self.params.parity_weight
+                          if (row + col) % 2 == 0 else 1.0)
+                for weight, (row, col) in zip(weights, cells)
+            ]
+        return weights
+
+    def _make_targeted_shot(self) -> Optional[Tuple[int, int]]:
+        """
+        Целевой выстрел по подбитому кораблю.
+
+        Returns:
+            Optional[Tuple[int, int]]: Координаты для выстрела или None
+        """
+        for cluster in self.clusters:
+            targets = self._cluster_targets(cluster)
+            if targets:
+                return targets[0]
         return None
 
+    def _cluster_targets(
+        self,
+        cluster: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """
+        Клетки, где может продолжаться подбитый корабль.
+
+        Args:
+            cluster: Попадания по одному кораблю (по порядку)
+
+        Returns:
+            List[Tuple[int, int]]: Клетки-кандидаты для добивания
+        """
+        if len(cluster) == 1:
+            row, col = cluster[0]
+            count = len(self.directions)
+            order = [self.directions[(self.current_direction + i) % count]
+                     for i in range(count)]
+            targets = [(row + delta_row, col + delta_col)
+                       for delta_row, delta_col in order]
+        else:
+            # Направление известно: продолжаем только с концов ряда
+            (first_row, first_col), (last_row, last_col) = cluster[0], cluster[-1]
+            if first_row == last_row:
+                targets = [(last_row, last_col + 1), (first_row, first_col - 1)]
+            else:
+                targets = [(last_row + 1, last_col), (first_row - 1, first_col)]
+
+        return [cell for cell in targets if cell in self.candidates]
+
     def register_result(self, row: int, col: int, result: str) -> None:
         """
         Регистрация результата выстрела.
@@ -107,17 +257,122 @@ class AIPlayer(Player):
         Args:
             row: Строка выстрела
             col: Столбец выстрела
-            result: Результат выстрела
+            result: Результат выстрела ('hit', 'miss' или 'invalid')
         """
+        if result == "invalid":
+            return
+
+        self.candidates.discard((row, col))
+
         if result == "hit":
             self.hits_history.append((row, col))
-            if not self.last_hit:
-                self.last_hit = (row, col)
-        elif result == "miss" and self.last_hit:
-            # Меняем направление при промахе после попадания
-            self.current_direction = (self.current_direction + 1) % len(
-                self.directions
-            )
+            self._add_hit(row, col)
+        elif result == "miss":
+            self.misses_history.append((row, col))
+            if self.clusters:
+                # Меняем направление при промахе после попадания
+                self.current_direction = self._next_direction()
+
+        self._check_sunk()
+
+    def _add_hit(self, row: int, col: int) -> None:
+        """
+        Учет попадания: объединение с соседними попаданиями.
+
+        Args:
+            row: Строка попадания
+            col: Столбец попадания
+        """
+        # Корабли прямые и не касаются, поэтому по диагонали от попадания
+        # корабля быть не может
+        self._exclude((row + delta_row, col + delta_col)
+                      for delta_row in (-1, 1) for delta_col in (-1, 1))
+
+        cluster = [(row, col)]
+        others = []
+        for other in self.clusters:
+            if any(abs(other_row - row) + abs(other_col - col) == 1
+                   for other_row, other_col in other):
+                cluster.extend(other)
+            else:
+                others.append(other)
+        cluster.sort()
+        self.clusters = others + [cluster]
+
+        # Два попадания в ряд задают направление: клетки сбоку исключаем
+        if len(cluster) > 1:
+            horizontal = cluster[0][0] == cluster[-1][0]
+            for cell_row, cell_col in cluster:
+                if horizontal:
+                    self._exclude([(cell_row - 1, cell_col),
+                                   (cell_row + 1, cell_col)])
+                else:
+                    self._exclude([(cell_row, cell_col - 1),
+                                   (cell_row, cell_col + 1)])
+
+    def _check_sunk(self) -> None:
+        """Поиск потопленных кораблей среди подбитых."""
+        largest = max(self.remaining_ships, default=0)
+
+        for cluster in list(self.clusters):
+            # Корабль потоплен, если длиннее быть не может или продолжить
+            # его уже некуда
+            if len(cluster) >= largest or not self._cluster_targets(cluster):
+                self._mark_sunk(cluster)
+
+    def _mark_sunk(self, cluster: List[Tuple[int, int]]) -> None:
+        """
+        Учет потопленного корабля: его ореол исключается из поиска.
+
+        Args:
+            cluster: Клетки потопленного корабля
+        """
+        self.clusters.remove(cluster)
+        if len(cluster) in self.remaining_ships:
+            self.remaining_ships.remove(len(cluster))
+        self.current_direction = 0
+
+        self._exclude((row + delta_row, col + delta_col)
+                      for row, col in cluster
+                      for delta_row in (-1, 0, 1)
+                      for delta_col in (-1, 0, 1))
+
+    def _exclude(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Исключение клеток, где корабля быть не может.
+
+        Args:
+            cells: Клетки для исключения
+        """
+        self.candidates.difference_update(cells)
+
+    def _next_direction(self) -> int:
+        """
+        Направление добивания после промаха.
+
+        Returns:
+            int: Индекс направления в self.directions
+        """
+        if self.params.miss_policy == "reverse":
+            delta_row, delta_col = self.directions[self.current_direction]
+            opposite = (-delta_row, -delta_col)
+            if opposite in self.directions:
+                return self.directions.index(opposite)
+        return (self.current_direction + 1) % len(self.directions)
+
+    def learn_opponent_placement(self, enemy_board: Board) -> None:
+        """
+        Запоминание расстановки противника по итогам партии.
+
+        Args:
+            enemy_board: Доска противника с его кораблями
+        """
+        if self.model is None or self.model.size != enemy_board.size:
+            return
+
+        self.model.record_placement(enemy_board.ships)
+        if self.model_path:
+            self.model.save(self.model_path)
 
     def place_ships(self, board: Board) -> None:
         """
@@ -126,9 +381,14 @@ class AIPlayer(Player):
         Args:
             board: Доска для размещения
         """
-        ships = [3, 2, 2, 1, 1, 1, 1]
-        placer = ShipPlacer(board, ships)
-        
+        placer = ShipPlacer(board, ShipPlacer.DEFAULT_SHIPS, self.rng)
+
+        # В сложном режиме берем одну из заранее найденных расстановок
+        if self.layouts:
+            if placer.place_layout(self.rng.choice(self.layouts)):
+                return
+            board.clear_board()
+
         if not placer.auto_place():
             print("Ошибка: не удалось разместить корабли компьютера")
             # Попробуем очистить доску и разместить снова
@@ -137,7 +397,12 @@ class AIPlayer(Player):
 
     def reset(self) -> None:
         """Сброс состояния ИИ."""
-        self.last_hit = None
         self.current_direction = 0
         self.hits_history = []
+        self.misses_history = []
+        self.endgame = None
+        self.candidates = set()
+        self.board_size = 0
+        self.clusters = []
+        self.remaining_ships = list(ShipPlacer.DEFAULT_SHIPS)
         self.reset_score()
\ No newline at end of file
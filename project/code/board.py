@@ -1,5 +1,5 @@
 """Модуль для работы с игровой доской."""
-from typing import List, Tuple
+from typing import Iterator, List, Protocol, Sequence, Tuple
 
 
 class Board:
@@ -21,6 +21,9 @@ class Board:
         self.size = size
         self.grid = self._create_empty_grid()
         self.ships_hit = 0
+        self.ships: List[Tuple[int, int, int, bool]] = []
+        # Журнал выстрелов для отката: (строка, столбец, прежнее значение)
+        self.journal: List[Tuple[int, int, str]] = []
 
     def _create_empty_grid(self) -> List[List[str]]:
         """Создание пустой сетки доски.
@@ -37,17 +40,34 @@ class Board:
         Args:
             show_ships: Показывать ли корабли (True) или скрывать их (False)
         """
+        print(self.render(show_ships))
+
+    def render(self, show_ships: bool = False) -> str:
+        """Текстовое представление доски.
+
+        Args:
+            show_ships: Показывать ли корабли (True) или скрывать их (False)
+
+        Returns:
+            str: Доска в том виде, в котором она выводится в консоль
+        """
+        # Ширина колонки по самому длинному номеру, чтобы двузначные
+        # номера стояли над своими клетками
+        width = len(str(self.size - 1))
+
         # Заголовок с номерами столбцов
-        print("   " + " ".join(str(i) for i in range(self.size)))
-        
+        lines = [" " * (width + 2) +
+                 " ".join(str(i).rjust(width) for i in range(self.size))]
+
         for i in range(self.size):
             row_display = []
             for cell in self.grid[i]:
                 if cell == Board.SHIP and not show_ships:
-                    row_display.append(Board.WATER)
-                else:
-                    row_display.append(cell)
-            print(f"{i} |" + " ".join(row_display) + "|")
+                    cell = Board.WATER
+                row_display.append(cell.rjust(width))
+            lines.append(f"{str(i).rjust(width)} |" +
+                         " ".join(row_display) + "|")
+        return "\n".join(lines)
 
     def place_ship(
         self,
@@ -75,6 +95,7 @@ class Board:
             current_row = row + (0 if horizontal else i)
             current_col = col + (i if horizontal else 0)
             self.grid[current_row][current_col] = Board.SHIP
+        self.ships.append((row, col, size, horizontal))
         return True
 
     def _can_place_ship(
@@ -101,7 +122,7 @@ class Board:
             current_col = col + (i if horizontal else 0)
 
             # Проверка границ доски
-            if current_row >= self.size or current_col >= self.size:
+            if not self._is_valid_coordinate(current_row, current_col):
                 return False
 
             # Проверка соседних клеток на наличие кораблей
@@ -157,6 +178,64 @@ class Board:
         self.grid[row][col] = Board.MISS
         return "miss"
 
+    def apply_shot(self, row: int, col: int) -> str:
+        """
+        Выстрел с записью в журнал, чтобы его можно было отменить.
+
+        Args:
+            row: Строка для выстрела
+            col: Столбец для выстрела
+
+        Returns:
+            str: Результат выстрела ('hit', 'miss' или 'invalid')
+        """
+        previous = (self.grid[row][col]
+                    if self._is_valid_coordinate(row, col) else "")
+        result = self.make_shot(row, col)
+        if result != "invalid":
+            self.journal.append((row, col, previous))
+        return result
+
+    def undo(self) -> bool:
+        """
+        Отмена последнего выстрела из журнала.
+
+        Счетчик попаданий восстанавливается по прежнему значению клетки.
+
+        Returns:
+            bool: False если журнал пуст
+        """
+        if not self.journal:
+            return False
+
+        row, col, previous = self.journal.pop()
+        if previous == Board.SHIP:
+            self.ships_hit -= 1
+        self.grid[row][col] = previous
+        return True
+
+    def checkpoint(self) -> int:
+        """
+        Отметка текущего состояния для последующего отката.
+
+        Отметки можно вкладывать: откат к внешней отметке отменяет
+        и все выстрелы после внутренних.
+
+        Returns:
+            int: Отметка (длина журнала)
+        """
+        return len(self.journal)
+
+    def rollback(self, checkpoint: int) -> None:
+        """
+        Откат всех выстрелов, сделанных после отметки.
+
+        Args:
+            checkpoint: Отметка, полученная от checkpoint()
+        """
+        while len(self.journal) > checkpoint:
+            self.undo()
+
     def _is_valid_coordinate(self, row: int, col: int) -> bool:
         """
         Проверка корректности координат.
@@ -197,4 +276,144 @@ class Board:
     def clear_board(self) -> None:
         """Очистка доски (для новой игры)."""
         self.grid = self._create_empty_grid()
-        self.ships_hit = 0
\ No newline at end of file
+        self.ships_hit = 0
+        self.ships = []
+        self.journal = []
+
+
+class BoardView(Protocol):
+    """Доска только для чтения.
+
+    Общий интерфейс Board и FogOfWarView: его получает Player.make_shot
+    и принимает вывод на экран.
+    """
+
+    @property
+    def size(self) -> int:
+        """Размер доски."""
+        ...
+
+    @property
+    def grid(self) -> Sequence[Sequence[str]]:
+        """Клетки доски: grid[row][col]."""
+        ...
+
+    def get_empty_cells(self) -> List[Tuple[int, int]]:
+        """Получение списка необстрелянных клеток.
+
+        Returns:
+            List[Tuple[int, int]]: Список координат необстрелянных клеток
+        """
+        ...
+
+    def render(self, show_ships: bool = False) -> str:
+        """Текстовое представление доски.
+
+        Args:
+            show_ships: Показывать ли корабли
+
+        Returns:
+            str: Доска в том виде, в котором она выводится в консоль
+        """
+        ...
+
+    def display(self, show_ships: bool = False) -> None:
+        """Отображение доски в консоли.
+
+        Args:
+            show_ships: Показывать ли корабли
+        """
+        ...
+
+
+class FogOfWarView:
+    """Класс для просмотра доски противника без его кораблей.
+
+    Не копирует доску: клетки с кораблями при чтении выдаются как вода.
+    Реализует BoardView, поэтому передается в Player.make_shot
+    и выводится на экран вместо доски.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """
+        Инициализация представления.
+
+        Args:
+            board: Доска, которую нужно скрыть
+        """
+        self.board = board
+        self.grid = _FogGrid(board)
+
+    @property
+    def size(self) -> int:
+        """Размер доски."""
+        return self.board.size
+
+    def render(self, show_ships: bool = False) -> str:
+        """Текстовое представление доски без кораблей.
+
+        Args:
+            show_ships: Игнорируется - корабли всегда скрыты
+
+        Returns:
+            str: Доска в том виде, в котором она выводится в консоль
+        """
+        return self.board.render(show_ships=False)
+
+    def display(self, show_ships: bool = False) -> None:
+        """Отображение доски в консоли без кораблей.
+
+        Args:
+            show_ships: Игнорируется - корабли всегда скрыты
+        """
+        self.board.display(show_ships=False)
+
+    def get_empty_cells(self) -> List[Tuple[int, int]]:
+        """Получение списка необстрелянных клеток.
+
+        Returns:
+            List[Tuple[int, int]]: Список координат необстрелянных клеток
+        """
+        return self.board.get_empty_cells()
+
+
+class _FogGrid(Sequence["_FogRow"]):
+    """Строки доски, в которых корабли выглядят как вода."""
+
+    def __init__(self, board: Board) -> None:
+        """Инициализация по исходной доске."""
+        self.board = board
+
+    def __len__(self) -> int:
+        """Количество строк."""
+        return self.board.size
+
+    def __getitem__(self, row: int) -> "_FogRow":
+        """Строка доски с номером row."""
+        return _FogRow(self.board.grid[row])
+
+    def __iter__(self) -> Iterator["_FogRow"]:
+        """Перебор строк доски."""
+        return (_FogRow(row) for row in self.board.grid)
+
+
+class _FogRow(Sequence[str]):
+    """Одна строка доски, в которой корабли выглядят как вода."""
+
+    def __init__(self, cells: List[str]) -> None:
+        """Инициализация по строке исходной доски."""
+        self.cells = cells
+
+    def __len__(self) -> int:
+        """Количество клеток в строке."""
+        return len(self.cells)
+
+    def __getitem__(self, col: int) -> str:
+        """Клетка строки (корабль выдается как вода)."""
+        cell = self.cells[col]
+        return Board.WATER if cell == Board.SHIP else cell
+
+    def __iter__(self) -> Iterator[str]:
+        """Перебор клеток строки."""
+        return (Board.WATER if cell == Board.SHIP else cell
+                for cell in self.cells)
\ No newline at end of file
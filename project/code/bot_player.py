@@ -0,0 +1,283 @@
+"""Модуль для игры против внешних ботов через стандартный ввод/вывод.
+
+Протокол строковый, одна команда на строку:
+
+    игра -> бот: GAME <размер> <размеры кораблей через пробел>
+    бот -> игра: PLACE <строка>,<столбец>,<h|v> ...  (все корабли сразу)
+
+    игра -> бот: SHOT [<строка>,<столбец>,<h|m|i> ...]
+    бот -> игра: <строка> <столбец>
+
+    игра -> бот: END <win|loss>                       (без ответа)
+    игра -> бот: QUIT                                 (без ответа)
+
+Результаты своих выстрелов бот получает не отдельными сообщениями,
+а пачкой в следующей команде SHOT: h - попадание, m - промах,
+i - некорректный выстрел (вне доски или в обстрелянную клетку; ход
+при этом переходит к противнику). Процесс бота запускается один раз
+и обслуживает любое количество партий подряд.
+"""
+import queue
+import subprocess
+import threading
+from typing import List, Optional, Tuple
+
+from board import (
+    Board,
+    BoardView,
+    )
+from player import (
+    Player,
+    )
+from ship_placer import (
+    Layout,
+    ShipPlacer,
+    )
+
+
+class BotError(RuntimeError):
+    """Бот нарушил протокол или не ответил вовремя."""
+
+    def __init__(self, message: str, player: Optional[str] = None) -> None:
+        """
+        Инициализация ошибки.
+
+        Args:
+            message: Описание ошибки
+            player: Имя игрока-бота, если оно известно
+        """
+        super().__init__(message)
+        self.player = player
+
+
+class BotProcess:
+    """Класс для постоянного процесса внешнего бота."""
+
+    def __init__(self, command: List[str], timeout: float = 1.0) -> None:
+        """
+        Инициализация (процесс запускается при первом запросе).
+
+        Args:
+            command: Команда запуска бота
+            timeout: Время на ответ в секундах
+        """
+        self.command = command
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+        self.replies: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def start(self) -> None:
+        """Запуск процесса бота и потока чтения его ответов."""
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read_replies,
+                         args=(self.process, self.replies),
+                         daemon=True).start()
+
+    def _read_replies(self, process: subprocess.Popen,
+                      replies: "queue.Queue[Optional[str]]") -> None:
+        """
+        Чтение строк бота в очередь (выполняется в отдельном потоке).
+
+        Args:
+            process: Процесс бота
+            replies: Очередь для ответов
+        """
+        for line in process.stdout:
+            replies.put(line.strip())
+        replies.put(None)
+
+    def send(self, message: str) -> None:
+        """
+        Отправка команды без ожидания ответа.
+
+        Args:
+            message: Команда протокола
+        """
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+        try:
+            self.process.stdin.write(message + "\n")
+            self.process.stdin.flush()
+        except OSError as error:
+            self.stop()
+            raise BotError(f"Бот {self.command[0]} завершился") from error
+
+    def request(self, message: str) -> str:
+        """
+        Отправка команды и ожидание ответа.
+
+        Args:
+            message: Команда протокола
+
+        Returns:
+            str: Ответ бота
+        """
+        self.send(message)
+        try:
+            reply = self.replies.get(timeout=self.timeout)
+        except queue.Empty:
+            # Бот мог ответить позже и сбить порядок ответов - перезапускаем
+            self.stop()
+            raise BotError(f"Бот {self.command[0]} не ответил за "
+                           f"{self.timeout} с") from None
+
+        if reply is None:
+            self.stop()
+            raise BotError(f"Бот {self.command[0]} завершился")
+        return reply
+
+    def stop(self) -> None:
+        """Завершение процесса бота."""
+        if self.process is None:
+            return
+
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.write("QUIT\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=self.timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+
+    def __enter__(self) -> "BotProcess":
+        """Запуск в блоке with."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Завершение при выходе из блока with."""
+        self.stop()
+
+
+class BotPlayer(Player):
+    """Класс для игрока, которым управляет внешний бот."""
+
+    def __init__(self, process: BotProcess, name: str = "Бот") -> None:
+        """
+        Инициализация игрока-бота.
+
+        Args:
+            process: Процесс бота (используется повторно между партиями)
+            name: Имя игрока
+        """
+        super().__init__(name)
+        self.process = process
+        self.pending_results: List[str] = []
+
+    def place_ships(self, board: Board) -> None:
+        """
+        Разместить корабли по ответу бота.
+
+        Args:
+            board: Доска для размещения
+        """
+        self.pending_results = []
+        ships = ShipPlacer.DEFAULT_SHIPS
+        reply = self._request(
+            f"GAME {board.size} " + " ".join(str(size) for size in ships)
+        )
+
+        layout = self._parse_layout(reply, ships)
+        if not ShipPlacer(board, ships).place_layout(layout):
+            board.clear_board()
+            raise BotError(f"{self.name}: недопустимая расстановка",
+                           self.name)
+
+    def _request(self, message: str) -> str:
+        """
+        Запрос к процессу бота с указанием игрока в ошибках.
+
+        Args:
+            message: Команда протокола
+
+        Returns:
+            str: Ответ бота
+        """
+        try:
+            return self.process.request(message)
+        except BotError as error:
+            raise BotError(f"{self.name}: {error}", self.name) from error
+
+    def _parse_layout(self, reply: str, ships: List[int]) -> Layout:
+        """
+        Разбор ответа PLACE.
+
+        Args:
+            reply: Ответ бота
+            ships: Размеры кораблей по порядку
+
+        Returns:
+            Layout: Расстановка кораблей
+        """
+        tokens = reply.split()
+        if not tokens or tokens[0] != "PLACE" or len(tokens) != len(ships) + 1:
+            raise BotError(f"{self.name}: ожидался PLACE, получено {reply!r}",
+                           self.name)
+
+        layout = []
+        try:
+            for ship_size, token in zip(ships, tokens[1:]):
+                row, col, direction = token.split(",")
+                layout.append((int(row), int(col), ship_size, direction == "h"))
+        except ValueError:
+            raise BotError(f"{self.name}: ошибка в {token!r}",
+                           self.name) from None
+        return layout
+
+    def make_shot(self, enemy_board: BoardView) -> Tuple[int, int]:
+        """
+        Запрос выстрела у бота (с результатами прошлых выстрелов).
+
+        Args:
+            enemy_board: Доска противника
+
+        Returns:
+            Tuple[int, int]: Координаты выстрела
+        """
+        message = " ".join(["SHOT"] + self.pending_results)
+        self.pending_results = []
+        reply = self._request(message)
+
+        try:
+            row, col = (int(value) for value in reply.split())
+        except ValueError:
+            raise BotError(f"{self.name}: ожидался выстрел, "
+                           f"получено {reply!r}", self.name) from None
+        return row, col
+
+    def register_result(self, row: int, col: int, result: str) -> None:
+        """
+        Запоминание результата до следующего запроса выстрела.
+
+        Args:
+            row: Строка выстрела
+            col: Столбец выстрела
+            result: Результат выстрела
+        """
+        self.pending_results.append(f"{row},{col},{result[0]}")
+
+    def finish_game(self, won: bool) -> None:
+        """
+        Сообщение боту об итоге партии.
+
+        Args:
+            won: Победил ли бот
+        """
+        self.pending_results = []
+        try:
+            self.process.send("END " + ("win" if won else "loss"))
+        except BotError as error:
+            raise BotError(f"{self.name}: {error}", self.name) from error
+
+    def reset(self) -> None:
+        """Сброс состояния между партиями."""
+        self.pending_results = []
+        self.reset_score()
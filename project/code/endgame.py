@@ -0,0 +1,297 @@
+"""Модуль для точного расчета последних выстрелов партии."""
+import time
+from typing import (Collection, Dict, FrozenSet, Iterable, List, Optional,
+                    Tuple)
+
+Cell = Tuple[int, int]
+
+
+class _BudgetExceeded(Exception):
+    """Превышен бюджет узлов (или времени), отведенный на расчет хода."""
+
+
+class EndgameSolver:
+    """Класс для точного решения эндшпиля.
+
+    Перебирает все расстановки флота, согласованные с попаданиями,
+    известными пустыми клетками и правилом "корабли не касаются",
+    и выбирает выстрел с минимальным ожидаемым числом оставшихся
+    выстрелов. Работает, только если таких расстановок не больше
+    config_limit и расчет укладывается в node_limit шагов.
+
+    Бюджет считается в шагах, пропорциональных работе (каждый вызов
+    перебора, включая отсеченные и найденные в памяти, плюс проверка
+    клеток по расстановкам), а не в секундах: ход ограничен по времени
+    и при этом зависит только от состояния партии, поэтому партия
+    с тем же зерном повторяется на любой машине и под профилировщиком.
+
+    Клетки доски хранятся битами целого числа: бит row * size + col.
+    """
+
+    def __init__(
+        self,
+        board_size: int,
+        ships: List[int],
+        config_limit: int = 25,
+        node_limit: int = 40000,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """
+        Инициализация решателя.
+
+        Args:
+            board_size: Размер доски
+            ships: Список размеров кораблей
+            config_limit: Порог числа расстановок для включения решателя
+            node_limit: Предел шагов перебора на один ход
+                (около 1 мкс на шаг, то есть порядка 40 мс)
+            time_limit: Дополнительный предел времени на ход в секундах
+                (None - без него; с ним ходы зависят от скорости машины)
+        """
+        self.size = board_size
+        self.ships = sorted(ships, reverse=True)
+        self.config_limit = config_limit
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.deadline: Optional[float] = None
+        self.memo: Dict[FrozenSet[int], Tuple[float, int]] = {}
+        self.configs: Optional[List[int]] = None
+
+    def choose_shot(self, hits: Iterable[Cell],
+                    unknown: Collection[Cell]) -> Optional[Cell]:
+        """
+        Выбор выстрела в эндшпиле.
+
+        Все клетки, кроме попаданий и unknown, считаются пустыми.
+
+        Args:
+            hits: Клетки с попаданиями
+            unknown: Необстрелянные клетки, где еще может быть корабль
+
+        Returns:
+            Optional[Cell]: Лучший выстрел или None, если до эндшпиля
+            еще далеко или расчет не уложился в бюджет
+        """
+        # Пока неизвестных клеток больше порога, расстановок почти
+        # наверняка тоже больше - перебор даже не начинаем
+        if self.configs is None and len(unknown) > self.config_limit:
+            return None
+
+        hits_mask = self._to_mask(hits)
+        misses_mask = ((1 << self.size ** 2) - 1) & ~(
+            hits_mask | self._to_mask(unknown))
+        self.nodes = 0
+        self.deadline = (None if self.time_limit is None
+                         else time.monotonic() + self.time_limit)
+
+        try:
+            # Новые наблюдения только сужают множество расстановок, поэтому
+            # однажды найденный список дальше лишь фильтруется
+            if self.configs is None:
+                self.configs = self._enumerate(hits_mask, misses_mask)
+                if self.configs is None:
+                    return None
+            self.configs = [config for config in self.configs
+                            if config & hits_mask == hits_mask and
+                            not config & misses_mask]
+
+            # Состояние - необстрелянные клетки кораблей каждой расстановки
+            remaining = [config & ~hits_mask for config in self.configs]
+            remaining = [cells for cells in remaining if cells]
+            if not remaining:
+                return None
+            bit = self._solve(remaining)[1]
+        except _BudgetExceeded:
+            return None
+
+        index = bit.bit_length() - 1
+        return divmod(index, self.size)
+
+    def _count_node(self, cost: int = 1) -> None:
+        """
+        Учет работы перебора; прерывает расчет при исчерпании бюджета.
+
+        Args:
+            cost: Объем работы узла в элементарных шагах
+        """
+        self.nodes += cost
+        if self.nodes > self.node_limit:
+            raise _BudgetExceeded
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise _BudgetExceeded
+
+    def _to_mask(self, cells: Iterable[Cell]) -> int:
+        """
+        Перевод списка клеток в битовую маску.
+
+        Args:
+            cells: Координаты клеток
+
+        Returns:
+            int: Маска клеток
+        """
+        mask = 0
+        for row, col in cells:
+            mask |= 1 << (row * self.size + col)
+        return mask
+
+    def _build_placements(self, ship_size: int,
+                          allowed: int) -> List[Tuple[int, int]]:
+        """
+        Положения корабля, целиком лежащие в разрешенных клетках.
+
+        Перебираются только разрешенные клетки, а не вся доска: в эндшпиле
+        их мало, поэтому стоимость не зависит от размера доски.
+
+        Args:
+            ship_size: Размер корабля
+            allowed: Маска клеток, где может стоять корабль
+
+        Returns:
+            List[Tuple[int, int]]: Маска клеток корабля и маска клеток
+            вместе с соседними (ореол)
+        """
+        placements = []
+        orientations = [True] if ship_size == 1 else [True, False]
+
+        remaining = allowed
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            row, col = divmod(bit.bit_length() - 1, self.size)
+
+            for horizontal in orientations:
+                cells = [(row + (0 if horizontal else i),
+                          col + (i if horizontal else 0))
+                         for i in range(ship_size)]
+                if any(r >= self.size or c >= self.size for r, c in cells):
+                    continue
+                mask = self._to_mask(cells)
+                if mask & ~allowed:
+                    continue
+                halo = [(r + dr, c + dc)
+                        for r, c in cells
+                        for dr in (-1, 0, 1)
+                        for dc in (-1, 0, 1)
+                        if 0 <= r + dr < self.size and
+                        0 <= c + dc < self.size]
+                placements.append((mask, self._to_mask(halo)))
+        return placements
+
+    def _enumerate(self, hits: int, misses: int) -> Optional[List[int]]:
+        """
+        Перебор расстановок флота, согласованных с наблюдениями.
+
+        Args:
+            hits: Маска попаданий
+            misses: Маска промахов
+
+        Returns:
+            Optional[List[int]]: Маски клеток кораблей каждой расстановки
+            или None, если расстановок больше config_limit
+        """
+        configs: List[int] = []
+        allowed = ((1 << self.size ** 2) - 1) & ~misses
+        self._count_node(bin(allowed).count("1") * len(set(self.ships)))
+        # Попадание рядом с кораблем, но не в него, нарушает правило касания
+        candidates = {
+            ship_size: [(cells, halo) for cells, halo
+                        in self._build_placements(ship_size, allowed)
+                        if not halo & ~cells & hits]
+            for ship_size in set(self.ships)
+        }
+
+        def place(index: int, start: int, blocked: int,
+                  occupied: int, capacity: int) -> bool:
+            # Учитывается каждый вызов, в том числе отсеченный
+            self._count_node()
+            if bin(hits & ~occupied).count("1") > capacity:
+                return True
+            if index == len(self.ships):
+                configs.append(occupied)
+                return len(configs) <= self.config_limit
+
+            ship_size = self.ships[index]
+            options = candidates[ship_size]
+            # Одинаковые корабли ставим по возрастанию, чтобы не повторяться
+            first = (start if index > 0 and
+                     self.ships[index - 1] == ship_size else 0)
+            self._count_node(len(options) - first)
+
+            for position in range(first, len(options)):
+                cells, halo = options[position]
+                if cells & blocked:
+                    continue
+                if not place(index + 1, position + 1, blocked | halo,
+                             occupied | cells, capacity - ship_size):
+                    return False
+            return True
+
+        if not place(0, 0, 0, 0, sum(self.ships)):
+            return None
+        return configs
+
+    def _solve(self, remaining: List[int]) -> Tuple[float, int]:
+        """
+        Ожидаемое число выстрелов до победы и лучший выстрел.
+
+        Результат запоминается по наблюдаемому состоянию, сведенному
+        к необстрелянным клеткам кораблей каждой возможной расстановки:
+        разные порядки выстрелов, приводящие к одному состоянию,
+        считаются один раз, в том числе на следующих ходах.
+
+        Args:
+            remaining: Необстрелянные клетки кораблей (непустые маски)
+
+        Returns:
+            Tuple[float, int]: Ожидание и бит клетки для выстрела
+        """
+        key = frozenset(remaining)
+        self._count_node()
+        if key in self.memo:
+            return self.memo[key]
+
+        total = len(remaining)
+        union = 0
+        for cells in remaining:
+            union |= cells
+        # Каждая клетка объединения проверяется по всем расстановкам
+        self._count_node(bin(union).count("1") * total)
+
+        candidates = []
+        while union:
+            bit = union & -union
+            union ^= bit
+            count = sum(1 for cells in remaining if cells & bit)
+            candidates.append((count, bit))
+        candidates.sort(reverse=True)
+
+        best = (float("inf"), 0)
+        for count, bit in candidates:
+            alive = [cells & ~bit for cells in remaining
+                     if cells & bit and cells != bit]
+            missed = [cells for cells in remaining if not cells & bit]
+
+            # Отсечение: каждую оставшуюся клетку кораблей придется обстрелять
+            bound = 1.0 + sum(bin(cells).count("1")
+                              for cells in alive + missed) / total
+            if bound >= best[0]:
+                continue
+
+            expected = 1.0
+            if alive:
+                expected += len(alive) / total * self._solve(alive)[0]
+            if missed:
+                expected += len(missed) / total * self._solve(missed)[0]
+
+            if expected < best[0]:
+                best = (expected, bit)
+
+            # Клетка есть во всех расстановках: по ней стрелять нужно
+            # в любом случае, и это не хуже любого другого выстрела
+            if count == total:
+                break
+
+        self.memo[key] = best
+        return best
@@ -1,29 +1,96 @@
 """Основной модуль игры Морской бой."""
 import os
+from typing import List, Optional
 
 from ai_player import (
     AIPlayer,
     )
 from board import (
     Board,
+    BoardView,
+    FogOfWarView,
     )
 from human_player import (
     HumanPlayer,
     )
-
+from placement_search import (
+    DEFAULT_FILE as DEFAULT_LAYOUTS_FILE,
+    load_layouts,
+    )
+from random_streams import (
+    new_seed,
+    spawn_rng,
+    )
+from ship_placer import (
+    Layout,
+    )
+from spectator import (
+    Spectator,
+    )
+from viewport import (
+    Viewport,
+    )
 
 
 class Game:
     """Основной класс игры Морской бой."""
 
-    def __init__(self) -> None:
-        """Инициализация игры."""
-        self.board_size = 6
+    # Библиотека сложных расстановок (создается placement_search.py)
+    HARD_LAYOUTS_FILE = DEFAULT_LAYOUTS_FILE
+
+    # Модель расстановок игрока, накапливаемая между партиями. Файл
+    # хранит один размер доски, поэтому у каждого размера свой файл
+    OPPONENT_MODEL_FILE = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "opponent_model_{size}.bin"
+    )
+
+    # Доски больше этого размера выводятся окном с мини-картой
+    VIEWPORT_SIZE = 20
+
+    # Допустимые размеры поля (на меньшем поле флот не помещается)
+    MIN_BOARD_SIZE = 6
+    MAX_BOARD_SIZE = 100
+
+    # Команды прокрутки окон: клавиша -> (доска, сдвиг строк, сдвиг столбцов)
+    SCROLL_KEYS = {
+        "w": ("computer", -1, 0),
+        "s": ("computer", 1, 0),
+        "a": ("computer", 0, -1),
+        "d": ("computer", 0, 1),
+        "i": ("player", -1, 0),
+        "k": ("player", 1, 0),
+        "j": ("player", 0, -1),
+        "l": ("player", 0, 1),
+    }
+
+    def __init__(self, seed: Optional[int] = None,
+                 first_round: int = 1, board_size: int = 6) -> None:
+        """
+        Инициализация игры.
+
+        Сессия с заданным зерном играет без модели расстановок игрока:
+        модель меняется после каждой партии и в зерно не входит, а без
+        нее ходы компьютера зависят только от пары (зерно, партия).
+
+        Args:
+            seed: Зерно сессии (None - случайное, с моделью игрока)
+            first_round: Номер первой партии сессии
+            board_size: Размер поля по умолчанию
+        """
+        self.board_size = board_size
+        # Партия N сессии повторяется по паре (зерно, N)
+        self.use_model = seed is None
+        self.seed = seed if seed is not None else new_seed()
+        self.round = first_round - 1
         self.player: HumanPlayer
         self.computer: AIPlayer
         self.player_board: Board
         self.computer_board: Board
-        self.player_view: Board
+        self.player_board_fog: FogOfWarView
+        self.computer_board_fog: FogOfWarView
+        self.player_viewport: Viewport
+        self.computer_viewport: Viewport
 
     def clear_screen(self) -> None:
         """Очистка экрана консоли."""
@@ -41,16 +108,17 @@ class Game:
         print("=" * 60)
         print("\nГлавное меню:")
         print("1. Начать новую игру")
-        print("2. Правила игры")
-        print("3. Выход")
+        print("2. Наблюдать: компьютер против компьютера")
+        print("3. Правила игры")
+        print("4. Выход")
         print("\n" + "=" * 60)
 
         while True:
             try:
-                choice = int(input("\nВыберите пункт (1-3): "))
-                if 1 <= choice <= 3:
+                choice = int(input("\nВыберите пункт (1-4): "))
+                if 1 <= choice <= 4:
                     return choice
-                print("Пожалуйста, введите число от 1 до 3")
+                print("Пожалуйста, введите число от 1 до 4")
             except ValueError:
                 print("Пожалуйста, введите корректное число")
 
@@ -63,7 +131,8 @@ class Game:
         print("\nЦель игры:")
         print("• Первым потопить все корабли противника")
         print("\nПравила:")
-        print("• Игра ведется на поле 6x6")
+        print(f"• Игра ведется на поле {self.board_size}x{self.board_size} "
+              f"(размер выбирается перед партией)")
         print("• У каждого игрока 7 кораблей:")
         print("  - 1 корабль размером 3")
         print("  - 2 корабля размером 2")
@@ -80,14 +149,31 @@ class Game:
 
     def setup_game(self) -> None:
         """Настройка игровых досок."""
-        # Создаем игроков
-        self.player = HumanPlayer()
-        self.computer = AIPlayer()
+        self.board_size = self.choose_board_size()
+
+        # Создаем игроков, у каждого свой поток случайных чисел
+        self.round += 1
+        self.player = HumanPlayer(
+            rng=spawn_rng(self.seed, self.round, "player")
+        )
+        self.computer = AIPlayer(
+            self.choose_computer_layouts(),
+            (self.OPPONENT_MODEL_FILE.format(size=self.board_size)
+             if self.use_model else None),
+            self.board_size,
+            rng=spawn_rng(self.seed, self.round, "computer")
+        )
 
         # Создаем доски
         self.player_board = Board(self.board_size)
         self.computer_board = Board(self.board_size)
-        self.player_view = Board(self.board_size)
+        # Игроки видят доски друг друга только через туман войны
+        self.player_board_fog = FogOfWarView(self.player_board)
+        self.computer_board_fog = FogOfWarView(self.computer_board)
+        # Окна создаются заново: счетчики мини-карты относятся к партии
+        self.player_viewport = Viewport(self.VIEWPORT_SIZE, self.VIEWPORT_SIZE)
+        self.computer_viewport = Viewport(self.VIEWPORT_SIZE,
+                                          self.VIEWPORT_SIZE)
 
         # Расставляем корабли игрока
         print("\nИгрок расставляет корабли...")
@@ -97,6 +183,42 @@ class Game:
         print("\nКомпьютер расставляет корабли...")
         self.computer.place_ships(self.computer_board)
 
+    def choose_board_size(self) -> int:
+        """Выбор размера поля перед партией.
+
+        Returns:
+            int: Размер поля
+        """
+        question = (f"\nРазмер поля {self.MIN_BOARD_SIZE}-"
+                    f"{self.MAX_BOARD_SIZE} (Enter - {self.board_size}): ")
+        while True:
+            answer = input(question).strip()
+            if not answer:
+                return self.board_size
+            try:
+                size = int(answer)
+                if self.MIN_BOARD_SIZE <= size <= self.MAX_BOARD_SIZE:
+                    return size
+                print(f"Пожалуйста, введите число от {self.MIN_BOARD_SIZE} "
+                      f"до {self.MAX_BOARD_SIZE}")
+            except ValueError:
+                print("Пожалуйста, введите корректное число")
+
+    def choose_computer_layouts(self) -> List[Layout]:
+        """Выбор сложного режима расстановки компьютера.
+
+        Returns:
+            List[Layout]: Библиотека сложных расстановок (пустая - обычный режим)
+        """
+        layouts = load_layouts(self.HARD_LAYOUTS_FILE, self.board_size)
+        if not layouts:
+            return []
+
+        if self._ask_yes_no("\nСложная расстановка кораблей компьютера? "
+                            "(да/нет): "):
+            return layouts
+        return []
+
     def display_game_state(self) -> None:
         """Отображение текущего состояния игры."""
         self.clear_screen()
@@ -108,13 +230,29 @@ class Game:
         print(f"{self.computer.name}: {self.computer.get_score()} попаданий")
 
         print(f"\nДОСКА {self.player.name}:")
-        self.player_board.display(show_ships=True)
+        self.display_board(self.player_board, self.player_viewport,
+                           show_ships=True)
 
         print(f"\nДОСКА {self.computer.name}:")
-        self.player_view.display(show_ships=False)
+        self.display_board(self.computer_board_fog, self.computer_viewport)
 
         print("=" * 60)
 
+    def display_board(
+        self,
+        board: BoardView,
+        viewport: Viewport,
+        show_ships: bool = False
+    ) -> None:
+        """Отображение доски целиком или окном, если она слишком большая.
+
+        Args:
+            board: Доска или ее представление с туманом войны
+            viewport: Окно для этой доски
+            show_ships: Показывать ли корабли
+        """
+        print(viewport.render_board(board, show_ships))
+
     def player_turn(self) -> bool:
         """Ход игрока.
 
@@ -124,7 +262,7 @@ class Game:
         print(f"\nХод {self.player.name}")
 
         while True:
-            row, col = self.player.make_shot(self.computer_board)
+            row, col = self.player.make_shot(self.computer_board_fog)
 
             result = self.computer_board.make_shot(row, col)
 
@@ -132,14 +270,15 @@ class Game:
                 print("Некорректный выстрел! Попробуйте еще раз.")
                 continue
 
-            # Обновляем вид игрока
+            self.computer_viewport.record_shot(row, col, result,
+                                               self.board_size)
+            self.computer_viewport.center_on(row, col, self.board_size)
+
             if result == "hit":
-                self.player_view.grid[row][col] = Board.HIT
                 self.player.register_hit()
                 print("ПОПАДАНИЕ! ✅")
                 return True
 
-            self.player_view.grid[row][col] = Board.MISS
             print("ПРОМАХ! ❌")
             return False
 
@@ -150,11 +289,13 @@ class Game:
             bool: True если компьютер попал и ходит снова
         """
         print(f"\nХод {self.computer.name}")
-        row, col = self.computer.make_shot(self.player_board)
+        row, col = self.computer.make_shot(self.player_board_fog)
 
         print(f"{self.computer.name} стреляет в [{row}, {col}]")
 
         result = self.player_board.make_shot(row, col)
+        self.player_viewport.record_shot(row, col, result, self.board_size)
+        self.player_viewport.center_on(row, col, self.board_size)
 
         if result == "hit":
             print(f"{self.computer.name} попал в ваш корабль! 💥")
@@ -163,7 +304,7 @@ class Game:
             return True
 
         print(f"{self.computer.name} промахнулся")
-        self.computer.register_result(row, col, "miss")
+        self.computer.register_result(row, col, result)
         return False
 
     def check_game_over(self) -> bool:
@@ -192,6 +333,14 @@ class Game:
         print(f"{self.computer.name}: {self.computer.get_score()} попаданий")
         print(f"\nКораблей {self.player.name} осталось: {player_ships_remaining}")
         print(f"Кораблей {self.computer.name} осталось: {computer_ships_remaining}")
+        print(f"\nЗерно: {self.seed}, партия {self.round}")
+        if self.use_model:
+            # Модель меняется между партиями, точный повтор невозможен
+            print("Ходы компьютера учитывали модель ваших расстановок; "
+                  "точно повторяются партии сессий с --seed")
+        else:
+            print(f"Повтор: main.py --seed {self.seed} --round {self.round} "
+                  f"--size {self.board_size}")
 
         if computer_ships_remaining == 0:
             print("\n" + "=" * 60)
@@ -203,7 +352,8 @@ class Game:
             print("=" * 60)
 
         print(f"\nДоска {self.computer.name} (все корабли показаны):")
-        self.computer_board.display(show_ships=True)
+        self.display_board(self.computer_board, self.computer_viewport,
+                           show_ships=True)
 
     def play_round(self) -> None:
         """Игровой раунд."""
@@ -222,17 +372,89 @@ class Game:
                 if not hit:
                     player_turn = True
 
-            input("\nНажмите Enter для продолжения...")
+            self.pause()
             game_over = self.check_game_over()
 
+    def pause(self) -> None:
+        """Пауза между ходами; на больших досках - с прокруткой окон."""
+        if self.board_size <= self.VIEWPORT_SIZE:
+            input("\nНажмите Enter для продолжения...")
+            return
+
+        viewports = {"computer": self.computer_viewport,
+                     "player": self.player_viewport}
+        step = self.VIEWPORT_SIZE // 2
+        while True:
+            command = input("\nEnter - продолжить, w/a/s/d - окно доски "
+                            "компьютера, i/j/k/l - окно своей доски: ")
+            command = command.strip().lower()
+            if not command:
+                return
+            if any(key not in self.SCROLL_KEYS for key in command):
+                print("Неизвестная команда")
+                continue
+
+            # Несколько клавиш подряд ("ddd") сдвигают окно несколько раз
+            for key in command:
+                board, delta_rows, delta_cols = self.SCROLL_KEYS[key]
+                viewports[board].scroll(delta_rows * step, delta_cols * step,
+                                        self.board_size)
+            self.display_game_state()
+
+    def watch_computers(self) -> None:
+        """Режим наблюдения за игрой компьютера против компьютера."""
+        fps = self._ask_number("\nКадров в секунду (Enter - 4): ", 4.0)
+        speed = self._ask_number("Выстрелов в секунду (Enter - 2): ", 2.0)
+
+        # Зерно наблюдаемой партии выводится из зерна сессии
+        self.round += 1
+        seed = spawn_rng(self.seed, self.round, "spectator").getrandbits(63)
+
+        spectator = Spectator(self.board_size, fps, speed, seed)
+        spectator.run()
+        input("\nНажмите Enter для возврата в меню...")
+
+    def _ask_number(self, question: str, default: float) -> float:
+        """Запрос положительного числа с значением по умолчанию.
+
+        Args:
+            question: Текст вопроса
+            default: Значение при пустом вводе
+
+        Returns:
+            float: Введенное число
+        """
+        while True:
+            answer = input(question).strip()
+            if not answer:
+                return default
+            try:
+                value = float(answer)
+                if value > 0:
+                    return value
+                print("Пожалуйста, введите положительное число")
+            except ValueError:
+                print("Пожалуйста, введите корректное число")
+
     def ask_play_again(self) -> bool:
         """Спросить игрока, хочет ли он сыграть еще раз.
 
         Returns:
             bool: True если игрок хочет продолжить
         """
+        return self._ask_yes_no("\nХотите сыграть еще раз? (да/нет): ")
+
+    def _ask_yes_no(self, question: str) -> bool:
+        """Вопрос игроку с ответом да/нет.
+
+        Args:
+            question: Текст вопроса
+
+        Returns:
+            bool: True если игрок ответил 'да'
+        """
         while True:
-            answer = input("\nХотите сыграть еще раз? (да/нет): ").lower()
+            answer = input(question).lower()
             if answer in ["да", "д", "yes", "y"]:
                 return True
             elif answer in ["нет", "н", "no", "n"]:
@@ -246,8 +468,6 @@ class Game:
             self.player_board.clear_board()
         if hasattr(self, 'computer_board'):
             self.computer_board.clear_board()
-        if hasattr(self, 'player_view'):
-            self.player_view.clear_board()
 
         # Сбрасываем счет игроков
         if hasattr(self, 'player'):
@@ -264,6 +484,7 @@ class Game:
                 try:
                     self.setup_game()
                     self.play_round()
+                    self.computer.learn_opponent_placement(self.player_board)
                     self.show_results()
 
                     if not self.ask_play_again():
@@ -278,8 +499,11 @@ class Game:
                     self.reset_game()
 
             elif choice == 2:
-                self.display_rules()
+                self.watch_computers()
 
             elif choice == 3:
+                self.display_rules()
+
+            elif choice == 4:
                 print("\nСпасибо за игру! До свидания!")
                 return
\ No newline at end of file
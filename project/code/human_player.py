@@ -1,8 +1,10 @@
 """Модуль для управления человеческим игроком."""
-from typing import Tuple
+import random
+from typing import Optional, Tuple
 
 from board import (
     Board,
+    BoardView,
     )
 from ship_placer import (
     ShipPlacer,
@@ -10,21 +12,27 @@ from ship_placer import (
 from player import (
     Player,
     )
+from viewport import (
+    Viewport,
+    )
 
 
 class HumanPlayer(Player):
     """Класс для управления человеческим игроком."""
 
-    def __init__(self, name: str = "Игрок") -> None:
+    def __init__(self, name: str = "Игрок",
+                 rng: Optional[random.Random] = None) -> None:
         """
         Инициализация человеческого игрока.
 
         Args:
             name: Имя игрока
+            rng: Генератор для автоматической расстановки
         """
         super().__init__(name)
+        self.rng = rng or random.Random()
 
-    def make_shot(self, enemy_board: Board) -> Tuple[int, int]:
+    def make_shot(self, enemy_board: BoardView) -> Tuple[int, int]:
         """
         Сделать выстрел (ввод от пользователя).
 
@@ -34,10 +42,11 @@ class HumanPlayer(Player):
         Returns:
             Tuple[int, int]: Координаты выстрела
         """
+        last = enemy_board.size - 1
         while True:
             try:
-                row = int(input("Введите номер строки (0-5): "))
-                col = int(input("Введите номер столбца (0-5): "))
+                row = int(input(f"Введите номер строки (0-{last}): "))
+                col = int(input(f"Введите номер столбца (0-{last}): "))
 
                 if not (0 <= row < enemy_board.size and 
                         0 <= col < enemy_board.size):
@@ -56,7 +65,7 @@ class HumanPlayer(Player):
         Args:
             board: Доска для размещения
         """
-        ships = [3, 2, 2, 1, 1, 1, 1]
+        ships = ShipPlacer.DEFAULT_SHIPS
 
         print("\nВыберите режим расстановки:")
         print("1. Автоматическая расстановка")
@@ -83,7 +92,7 @@ class HumanPlayer(Player):
             board: Доска для размещения
             ships: Список размеров кораблей
         """
-        placer = ShipPlacer(board, ships)
+        placer = ShipPlacer(board, ships, self.rng)
         if placer.auto_place():
             print("\nКорабли успешно расставлены!")
         else:
@@ -102,20 +111,29 @@ class HumanPlayer(Player):
         print("Корабли для размещения:", ships)
 
         placer = ShipPlacer(board, ships)
+        viewport = Viewport()
 
         for ship_size in ships:
-            self._display_placement_board(board)
+            self._display_placement_board(board, viewport)
             self._place_single_ship_manual(placer, ship_size)
 
-    def _display_placement_board(self, board: Board) -> None:
+    def _display_placement_board(self, board: Board,
+                                 viewport: Viewport) -> None:
         """
         Отображение доски во время расстановки.
 
+        Большая доска выводится окном вокруг последнего корабля.
+
         Args:
             board: Доска для отображения
+            viewport: Окно для доски
         """
+        if board.ships:
+            row, col, _, _ = board.ships[-1]
+            viewport.center_on(row, col, board.size)
+
         print("\nВАША ДОСКА:")
-        board.display(show_ships=True)
+        print(viewport.render_board(board, show_ships=True))
 
     def _place_single_ship_manual(self, placer: ShipPlacer, 
                                   ship_size: int) -> None:
@@ -126,18 +144,19 @@ class HumanPlayer(Player):
             placer: Объект для размещения кораблей
             ship_size: Размер корабля для размещения
         """
+        last = placer.board.size - 1
         placed = False
         while not placed:
             print(f"\nРазмещаем корабль размером {ship_size}")
 
             try:
-                row = int(input("Введите номер строки (0-5): "))
-                col = int(input("Введите номер столбца (0-5): "))
+                row = int(input(f"Введите номер строки (0-{last}): "))
+                col = int(input(f"Введите номер столбца (0-{last}): "))
                 direction = input("Горизонтально (г) или Вертикально (в)? ")
 
                 horizontal = direction.lower() in ["г", "g", "h", "гор", "horizontal"]
 
-                if placer.manual_place_ship(row, col, ship_size, horizontal):
+                if placer.manual_place_ship(ship_size, row, col, horizontal):
                     placed = True
                     print(f"Корабль размером {ship_size} размещен!")
                 else:
@@ -1,4 +1,6 @@
 """Главный модуль для запуска игры Морской бой."""
+import argparse
+
 from game import (
     Game,
     )
@@ -6,8 +8,17 @@ from game import (
 
 def main() -> None:
     """Главная функция запуска игры."""
+    parser = argparse.ArgumentParser(description="Морской бой")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Зерно сессии для повтора партий")
+    parser.add_argument("--round", type=int, default=1,
+                        help="Номер партии, с которой начать сессию")
+    parser.add_argument("--size", type=int, default=6,
+                        help="Размер поля по умолчанию")
+    args = parser.parse_args()
+
     try:
-        game = Game()
+        game = Game(args.seed, args.round, args.size)
         game.run()
     except KeyboardInterrupt:
         print("\n\nИгра прервана. До свидания!")
@@ -0,0 +1,150 @@
+"""Модуль для запоминания того, где противник обычно ставит корабли."""
+import os
+import struct
+from array import array
+from typing import List, Tuple
+
+from ship_placer import (
+    Layout,
+    )
+
+
+class PlacementModel:
+    """Класс для накопления карты расстановок противника по партиям.
+
+    Для каждой клетки хранится взвешенное число партий, в которых там
+    стоял корабль. Старые партии затухают: вес каждой новой партии
+    в 1 / decay раз больше предыдущей, поэтому обновление затрагивает
+    только клетки кораблей, а не всю карту.
+    """
+
+    # Формат файла: сигнатура, размер доски, вес последней партии,
+    # суммарный вес партий, затем size * size чисел double
+    HEADER = struct.Struct("<4sHdd")
+    MAGIC = b"SBPM"
+
+    # Предел веса, после которого карта приводится к масштабу 1
+    RESCALE_LIMIT = 1e100
+
+    def __init__(self, board_size: int = 6, decay: float = 0.9) -> None:
+        """
+        Инициализация пустой модели.
+
+        Args:
+            board_size: Размер доски
+            decay: Во сколько раз ослабевает вклад партии с каждой новой
+        """
+        self.size = board_size
+        self.decay = decay
+        self.weights = array("d", bytes(8 * board_size * board_size))
+        self.scale = 1.0
+        self.mass = 0.0
+
+    def record_placement(self, layout: Layout) -> None:
+        """
+        Учет расстановки противника по итогам партии.
+
+        Args:
+            layout: Корабли противника (строка, столбец, размер, горизонтально)
+        """
+        self.scale /= self.decay
+        self.mass += self.scale
+
+        for row, col, ship_size, horizontal in layout:
+            for i in range(ship_size):
+                current_row = row + (0 if horizontal else i)
+                current_col = col + (i if horizontal else 0)
+                self.weights[current_row * self.size + current_col] += self.scale
+
+        if self.scale > self.RESCALE_LIMIT:
+            self._rescale()
+
+    def probability(self, row: int, col: int) -> float:
+        """
+        Доля (с учетом затухания) партий, где в клетке стоял корабль.
+
+        Args:
+            row: Строка клетки
+            col: Столбец клетки
+
+        Returns:
+            float: Оценка вероятности от 0 до 1 (0, если партий не было)
+        """
+        if not self.mass:
+            return 0.0
+        return self.weights[row * self.size + col] / self.mass
+
+    def hunt_weights(self, cells: List[Tuple[int, int]],
+                     floor: float = 0.1) -> List[float]:
+        """
+        Веса клеток для случайного поиска кораблей.
+
+        Args:
+            cells: Клетки-кандидаты
+            floor: Минимальный вес, чтобы не исключать клетки совсем
+
+        Returns:
+            List[float]: Вес каждой клетки
+        """
+        return [floor + self.probability(row, col) for row, col in cells]
+
+    def _rescale(self) -> None:
+        """Приведение весов к масштабу 1 (редкая операция)."""
+        for index in range(len(self.weights)):
+            self.weights[index] /= self.scale
+        self.mass /= self.scale
+        self.scale = 1.0
+
+    def save(self, path: str) -> None:
+        """
+        Сохранение модели в компактный двоичный файл.
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.size,
+                                        self.scale, self.mass))
+            self.weights.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, board_size: int = 6,
+             decay: float = 0.9) -> "PlacementModel":
+        """
+        Загрузка модели.
+
+        Размер файла зависит только от размера доски, поэтому загрузка
+        не замедляется с ростом числа сыгранных партий.
+
+        Args:
+            path: Путь к файлу
+            board_size: Размер доски
+            decay: Затухание для новых партий
+
+        Returns:
+            PlacementModel: Загруженная модель или пустая, если файла нет
+            или он для другого размера доски
+        """
+        model = cls(board_size, decay)
+        if not os.path.exists(path):
+            return model
+
+        with open(path, "rb") as file:
+            header = file.read(cls.HEADER.size)
+            if len(header) < cls.HEADER.size:
+                return model
+
+            magic, size, scale, mass = cls.HEADER.unpack(header)
+            if magic != cls.MAGIC or size != board_size:
+                return model
+
+            weights = array("d")
+            try:
+                weights.fromfile(file, board_size * board_size)
+            except EOFError:
+                return model
+
+        model.weights = weights
+        model.scale = scale
+        model.mass = mass
+        return model
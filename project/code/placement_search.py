@@ -0,0 +1,342 @@
+"""Модуль для поиска сложных расстановок кораблей."""
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, cast
+
+from ai_player import (
+    AIPlayer,
+    )
+from board import (
+    Board,
+    )
+from player import (
+    Player,
+    )
+from ship_placer import (
+    Layout,
+    ShipPlacer,
+    )
+from random_streams import (
+    new_seed,
+    spawn_rng,
+    )
+from simulation import (
+    count_shots_to_win,
+    )
+
+# Библиотека расстановок по умолчанию (ее читает игра)
+DEFAULT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "hard_layouts.json")
+
+# Найденные расстановки по множеству занятых клеток: (оценка, расстановка)
+Library = Dict[FrozenSet[Tuple[int, int]], Tuple[float, Layout]]
+
+
+def random_layout(board_size: int, ships: List[int],
+                  rng: random.Random) -> Layout:
+    """
+    Случайная корректная расстановка кораблей.
+
+    Args:
+        board_size: Размер доски
+        ships: Список размеров кораблей
+        rng: Генератор случайных чисел
+
+    Returns:
+        Layout: Расстановка кораблей
+    """
+    board = Board(board_size)
+    placer = ShipPlacer(board, ships, rng)
+
+    while not placer.auto_place():
+        board.clear_board()
+    return list(board.ships)
+
+
+def mutate_layout(layout: Layout, board_size: int, rng: random.Random,
+                  max_attempts: int = 100) -> Layout:
+    """
+    Соседняя расстановка: один корабль переносится на новое место.
+
+    Args:
+        layout: Исходная расстановка
+        board_size: Размер доски
+        rng: Генератор случайных чисел
+        max_attempts: Количество попыток найти корректный перенос
+
+    Returns:
+        Layout: Новая расстановка (исходная, если перенос не удался)
+    """
+    for _ in range(max_attempts):
+        index = rng.randrange(len(layout))
+        ship_size = layout[index][2]
+
+        board = Board(board_size)
+        others = layout[:index] + layout[index + 1:]
+        ShipPlacer(board, []).place_layout(others)
+
+        horizontal = rng.choice([True, False])
+        row = rng.randint(0, board_size - 1)
+        col = rng.randint(0, board_size - 1)
+        if board.place_ship(row, col, ship_size, horizontal):
+            return list(board.ships)
+
+    return list(layout)
+
+
+def evaluate_layout(
+    layout: Layout,
+    board_size: int,
+    games: int,
+    cutoff: Optional[float] = None,
+    shooter_factory: Callable[..., Player] = AIPlayer,
+    seed: int = 0
+) -> Optional[float]:
+    """
+    Среднее число выстрелов, нужных ИИ для победы над расстановкой.
+
+    Если после четверти партий среднее заметно ниже порога cutoff,
+    оценка прерывается: такая расстановка заведомо слабая, а среднее
+    по части партий несравнимо с полными оценками. Стрелок
+    партии N получает поток (seed, N), поэтому кандидаты с одним seed
+    сравниваются на одинаковых выстрелах.
+
+    Args:
+        layout: Расстановка кораблей
+        board_size: Размер доски
+        games: Количество партий для оценки
+        cutoff: Порог, ниже которого кандидат считается слабым
+        shooter_factory: Функция, создающая стрелка по аргументу rng
+        seed: Зерно партий оценки
+
+    Returns:
+        Optional[float]: Среднее количество выстрелов до победы или None,
+        если оценка прервана
+    """
+    check_after = max(1, games // 4)
+    total = 0
+
+    for played in range(1, games + 1):
+        board = Board(board_size)
+        ShipPlacer(board, []).place_layout(layout)
+        total += count_shots_to_win(
+            shooter_factory(rng=spawn_rng(seed, played)), board
+        )
+
+        if (cutoff is not None and played == check_after and
+                total / played < cutoff * PlacementSearch.CUTOFF_RATIO):
+            return None
+
+    return total / games
+
+
+class PlacementSearch:
+    """Класс для поиска сложных расстановок методом отжига."""
+
+    # Доля от текущей оценки, ниже которой кандидат отбрасывается досрочно
+    CUTOFF_RATIO = 0.9
+
+    def __init__(
+        self,
+        board_size: int = 6,
+        ships: Optional[List[int]] = None,
+        shooter_factory: Callable[..., Player] = AIPlayer,
+        games_per_layout: int = 40,
+        workers: Optional[int] = None,
+        temperature: float = 1.0,
+        cooling: float = 0.95,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Инициализация поиска.
+
+        Args:
+            board_size: Размер доски
+            ships: Список размеров кораблей
+            shooter_factory: Функция, создающая ИИ по аргументу rng
+            games_per_layout: Количество партий на оценку расстановки
+            workers: Количество процессов (None - по числу ядер)
+            temperature: Начальная температура отжига
+            cooling: Множитель охлаждения на каждой итерации
+            seed: Зерно всего поиска (None - случайное)
+        """
+        self.board_size = board_size
+        self.ships = ships or ShipPlacer.DEFAULT_SHIPS
+        self.shooter_factory = shooter_factory
+        self.games_per_layout = games_per_layout
+        self.workers = workers or os.cpu_count() or 1
+        self.temperature = temperature
+        self.cooling = cooling
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = spawn_rng(self.seed, "search")
+
+    def run(self, iterations: int,
+            library_size: int = 10) -> List[Tuple[float, Layout]]:
+        """
+        Запуск поиска.
+
+        На каждой итерации параллельно оцениваются соседние расстановки
+        (по одной на процесс), лучшая из них принимается по правилу
+        Метрополиса.
+
+        Args:
+            iterations: Количество итераций отжига
+            library_size: Количество лучших расстановок в результате
+
+        Returns:
+            List[Tuple[float, Layout]]: Оценки и расстановки по убыванию
+        """
+        library: Library = {}
+        current = random_layout(self.board_size, self.ships, self.rng)
+        # Без порога оценка не прерывается и всегда дает число
+        current_score = cast(float, evaluate_layout(
+            current, self.board_size, self.games_per_layout,
+            shooter_factory=self.shooter_factory,
+            seed=self.rng.getrandbits(63)
+        ))
+        self._remember(library, current_score, current)
+        temperature = self.temperature
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for _ in range(iterations):
+                candidates = [mutate_layout(current, self.board_size,
+                                            self.rng)
+                              for _ in range(self.workers)]
+                # Общее зерно: кандидаты итерации играют одни и те же партии
+                seed = self.rng.getrandbits(63)
+                scores = list(pool.map(
+                    evaluate_layout,
+                    candidates,
+                    repeat(self.board_size),
+                    repeat(self.games_per_layout),
+                    repeat(current_score),
+                    repeat(self.shooter_factory),
+                    repeat(seed)
+                ))
+
+                # Прерванные кандидаты не попадают ни в библиотеку,
+                # ни в выбор следующей расстановки
+                scored = [(score, candidate)
+                          for score, candidate in zip(scores, candidates)
+                          if score is not None]
+                for score, candidate in scored:
+                    self._remember(library, score, candidate)
+
+                if scored:
+                    best_score, best = max(scored, key=lambda item: item[0])
+                    delta = best_score - current_score
+                    if delta >= 0 or self.rng.random() < math.exp(
+                            delta / max(temperature, 1e-9)):
+                        current, current_score = best, best_score
+
+                temperature *= self.cooling
+
+        ranked = sorted(library.values(), key=lambda item: -item[0])
+        return ranked[:library_size]
+
+    def _remember(self, library: Library,
+                  score: float, layout: Layout) -> None:
+        """
+        Запоминание расстановки (одинаковые доски храним один раз).
+
+        Ключ - множество занятых клеток: однопалубный корабль занимает
+        одну клетку при любом значении horizontal.
+
+        Args:
+            library: Найденные расстановки
+            score: Оценка расстановки
+            layout: Расстановка кораблей
+        """
+        key = frozenset(
+            (row + (0 if horizontal else offset),
+             col + (offset if horizontal else 0))
+            for row, col, ship_size, horizontal in layout
+            for offset in range(ship_size)
+        )
+        if key not in library or library[key][0] < score:
+            library[key] = (score, layout)
+
+
+def save_layouts(path: str, board_size: int,
+                 layouts: List[Tuple[float, Layout]]) -> None:
+    """
+    Сохранение библиотеки расстановок в JSON.
+
+    Args:
+        path: Путь к файлу
+        board_size: Размер доски
+        layouts: Оценки и расстановки
+    """
+    data = {
+        "board_size": board_size,
+        "layouts": [
+            {"score": round(score, 2), "ships": [list(ship) for ship in layout]}
+            for score, layout in layouts
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+
+def load_layouts(path: str, board_size: int) -> List[Layout]:
+    """
+    Загрузка библиотеки расстановок.
+
+    Args:
+        path: Путь к файлу
+        board_size: Размер доски
+
+    Returns:
+        List[Layout]: Расстановки (пустой список, если файла нет или
+        он сделан для другого размера доски)
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    if data.get("board_size") != board_size:
+        return []
+    return [
+        [(row, col, size, bool(horizontal))
+         for row, col, size, horizontal in entry["ships"]]
+        for entry in data["layouts"]
+    ]
+
+
+def main() -> None:
+    """Запуск поиска из командной строки."""
+    parser = argparse.ArgumentParser(
+        description="Поиск расстановок, сложных для ИИ"
+    )
+    parser.add_argument("--size", type=int, default=6)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--library", type=int, default=10)
+    parser.add_argument("--output", default=DEFAULT_FILE)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    search = PlacementSearch(
+        board_size=args.size,
+        games_per_layout=args.games,
+        workers=args.workers,
+        seed=args.seed
+    )
+    print(f"Зерно поиска: {search.seed}")
+    layouts = search.run(args.iterations, args.library)
+    save_layouts(args.output, args.size, layouts)
+
+    for score, layout in layouts:
+        print(f"{score:6.2f}  {layout}")
+
+
+if __name__ == "__main__":
+    main()
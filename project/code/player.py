@@ -4,6 +4,7 @@ from typing import Tuple
 
 from board import (
     Board,
+    BoardView,
     )
 
 
@@ -21,12 +22,12 @@ class Player(ABC):
         self.score = 0
 
     @abstractmethod
-    def make_shot(self, enemy_board: Board) -> Tuple[int, int]:
+    def make_shot(self, enemy_board: BoardView) -> Tuple[int, int]:
         """
         Сделать выстрел.
 
         Args:
-            enemy_board: Доска противника
+            enemy_board: Доска противника (только для чтения, без кораблей)
 
         Returns:
             Tuple[int, int]: Координаты выстрела
@@ -43,6 +44,24 @@ class Player(ABC):
         """
         pass
 
+    def register_result(self, row: int, col: int, result: str) -> None:
+        """
+        Регистрация результата выстрела (по умолчанию игнорируется).
+
+        Args:
+            row: Строка выстрела
+            col: Столбец выстрела
+            result: Результат выстрела ('hit', 'miss' или 'invalid')
+        """
+
+    def finish_game(self, won: bool) -> None:
+        """
+        Уведомление об окончании партии (по умолчанию игнорируется).
+
+        Args:
+            won: Победил ли игрок
+        """
+
     def register_hit(self) -> None:
         """Зарегистрировать попадание."""
         self.score += 1
@@ -0,0 +1,46 @@
+"""Пример внешнего бота: случайная расстановка и случайные выстрелы.
+
+Запускается игрой как отдельный процесс (см. протокол в bot_player.py).
+"""
+import random
+import sys
+
+from board import (
+    Board,
+    )
+from ship_placer import (
+    ShipPlacer,
+    )
+
+
+def main() -> None:
+    """Цикл обработки команд протокола."""
+    unshot: list = []
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        command, *args = line.split()
+
+        if command == "GAME":
+            size, ships = int(args[0]), [int(value) for value in args[1:]]
+            board = Board(size)
+            ShipPlacer(board, ships).auto_place()
+            # Корабли ставятся в порядке команды, в нем же и отвечаем
+            print("PLACE " + " ".join(
+                f"{row},{col},{'h' if horizontal else 'v'}"
+                for row, col, _, horizontal in board.ships
+            ), flush=True)
+            unshot = [(row, col) for row in range(size) for col in range(size)]
+            random.shuffle(unshot)
+
+        elif command == "SHOT":
+            row, col = unshot.pop() if unshot else (0, 0)
+            print(f"{row} {col}", flush=True)
+
+        elif command == "QUIT":
+            return
+
+
+if __name__ == "__main__":
+    main()
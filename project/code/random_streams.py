@@ -0,0 +1,38 @@
+"""Модуль для независимых потоков случайных чисел из одного зерна.
+
+Каждый компонент (расстановка, стрелок, партия в серии) получает свой
+генератор random.Random, выведенный из зерна сессии и набора меток.
+Вывод стабилен между запусками и процессами, поэтому любую партию
+серии можно повторить отдельно, зная зерно и ее метки.
+"""
+import hashlib
+import random
+import secrets
+
+
+def new_seed() -> int:
+    """Новое зерно сессии из системного источника энтропии.
+
+    Returns:
+        int: Зерно сессии
+    """
+    return secrets.randbits(63)
+
+
+def spawn_rng(seed: int, *labels: object) -> random.Random:
+    """
+    Генератор для компонента, выведенный из зерна и меток.
+
+    Разные метки дают независимые потоки, одинаковые - один и тот же.
+    Используется SHA-256, а не hash(): он не зависит от PYTHONHASHSEED.
+
+    Args:
+        seed: Зерно сессии
+        labels: Метки компонента, например номер партии и роль
+
+    Returns:
+        random.Random: Генератор случайных чисел компонента
+    """
+    key = ":".join(str(part) for part in (seed, *labels))
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "little"))
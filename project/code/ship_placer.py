@@ -1,25 +1,35 @@
 """Модуль для размещения кораблей на доске."""
 import random
-from typing import List
+from typing import List, Optional, Tuple
 
 from board import (
     Board,
     )
 
+# Расстановка: список кораблей (строка, столбец, размер, горизонтально)
+Layout = List[Tuple[int, int, int, bool]]
+
 
 class ShipPlacer:
     """Класс для размещения кораблей на доске."""
 
-    def __init__(self, board: Board, ships: List[int]) -> None:
+    # Стандартный флот: 1 корабль на 3, 2 на 2 и 4 на 1 клетку
+    DEFAULT_SHIPS = [3, 2, 2, 1, 1, 1, 1]
+    MAX_RESTARTS = 20
+
+    def __init__(self, board: Board, ships: List[int],
+                 rng: Optional[random.Random] = None) -> None:
         """
         Инициализация разместителя кораблей.
 
         Args:
             board: Доска для размещения
             ships: Список размеров кораблей
+            rng: Генератор случайных чисел (None - новый, без зерна)
         """
         self.board = board
         self.ships = ships
+        self.rng = rng or random.Random()
 
     def auto_place(self) -> bool:
         """Автоматическое размещение всех кораблей.
@@ -27,10 +37,13 @@ class ShipPlacer:
         Returns:
             bool: Успешно ли размещены все корабли
         """
-        for ship_size in self.ships:
-            if not self._place_single_ship(ship_size):
-                return False
-        return True
+        # Жадная расстановка иногда заходит в тупик - тогда начинаем заново
+        for _ in range(self.MAX_RESTARTS):
+            if all(self._place_single_ship(ship_size)
+                   for ship_size in self.ships):
+                return True
+            self.board.clear_board()
+        return False
 
     def _place_single_ship(self, ship_size: int) -> bool:
         """Размещение одного корабля.
@@ -45,9 +58,9 @@ class ShipPlacer:
         attempts = 0
 
         while attempts < max_attempts:
-            horizontal = random.choice([True, False])
-            row = random.randint(0, self.board.size - 1)
-            col = random.randint(0, self.board.size - 1)
+            horizontal = self.rng.choice([True, False])
+            row = self.rng.randint(0, self.board.size - 1)
+            col = self.rng.randint(0, self.board.size - 1)
 
             if self.board.place_ship(row, col, ship_size, horizontal):
                 return True
@@ -75,4 +88,19 @@ class ShipPlacer:
         Returns:
             bool: Успешно ли размещен корабль
         """
-        return self.board.place_ship(row, col, ship_size, horizontal)
\ No newline at end of file
+        return self.board.place_ship(row, col, ship_size, horizontal)
+
+    def place_layout(self, layout: Layout) -> bool:
+        """
+        Размещение кораблей по готовой расстановке.
+
+        Args:
+            layout: Готовая расстановка кораблей
+
+        Returns:
+            bool: Успешно ли размещены все корабли
+        """
+        for row, col, ship_size, horizontal in layout:
+            if not self.board.place_ship(row, col, ship_size, horizontal):
+                return False
+        return True
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""Модуль для сбора статистики выстрелов по множеству партий."""
+import argparse
+import csv
+from array import array
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from ai_player import (
+    AIPlayer,
+    )
+from board import (
+    Board,
+    )
+from player import (
+    Player,
+    )
+from random_streams import (
+    new_seed,
+    spawn_rng,
+    )
+from simulation import (
+    simulate_shots,
+    )
+
+# Выстрел: строка, столбец и результат ('hit' или 'miss')
+Shot = Tuple[int, int, str]
+
+
+class ShotHeatmap:
+    """Класс для накопления тепловых карт попаданий и промахов."""
+
+    # Символы по возрастанию плотности для текстовой карты
+    SHADES = " .:-=+*#%@"
+
+    def __init__(self, board_size: int = 6) -> None:
+        """
+        Инициализация счетчиков.
+
+        Размер счетчиков фиксирован размером доски, поэтому память
+        не растет с количеством обработанных партий.
+
+        Args:
+            board_size: Размер доски
+        """
+        self.size = board_size
+        cells = board_size * board_size
+        self.hits = array("q", bytes(8 * cells))
+        self.misses = array("q", bytes(8 * cells))
+        self.first_hits = array("q", bytes(8 * cells))
+        self.hit_turns = array("q", bytes(8 * cells))
+        self.games = 0
+
+    def add_game(self, shots: Iterable[Shot]) -> None:
+        """
+        Учет одной партии.
+
+        Args:
+            shots: Выстрелы партии по порядку
+        """
+        first_hit = True
+        for turn, (row, col, result) in enumerate(shots, start=1):
+            index = row * self.size + col
+            if result == "hit":
+                self.hits[index] += 1
+                self.hit_turns[index] += turn
+                if first_hit:
+                    self.first_hits[index] += 1
+                    first_hit = False
+            elif result == "miss":
+                self.misses[index] += 1
+        self.games += 1
+
+    def consume(self, games: Iterable[Iterable[Shot]]) -> None:
+        """
+        Учет потока партий.
+
+        Args:
+            games: Партии, каждая из которых - последовательность выстрелов
+        """
+        for shots in games:
+            self.add_game(shots)
+
+    def average_hit_turn(self, row: int, col: int) -> float:
+        """
+        Средний номер выстрела, которым попадали в клетку.
+
+        Args:
+            row: Строка клетки
+            col: Столбец клетки
+
+        Returns:
+            float: Средний номер выстрела (0, если попаданий не было)
+        """
+        index = row * self.size + col
+        if not self.hits[index]:
+            return 0.0
+        return self.hit_turns[index] / self.hits[index]
+
+    def save_csv(self, path: str) -> None:
+        """
+        Сохранение карт в CSV (одна строка на клетку).
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["row", "col", "hits", "misses",
+                             "first_hits", "avg_hit_turn"])
+            for row in range(self.size):
+                for col in range(self.size):
+                    index = row * self.size + col
+                    writer.writerow([
+                        row, col, self.hits[index], self.misses[index],
+                        self.first_hits[index],
+                        round(self.average_hit_turn(row, col), 2),
+                    ])
+
+    def render(self, counts: array) -> str:
+        """
+        Текстовая карта в стиле Board.display.
+
+        Args:
+            counts: Один из счетчиков (hits, misses или first_hits)
+
+        Returns:
+            str: Карта, где плотность символа отражает значение в клетке
+        """
+        peak = max(counts) or 1
+        top = len(self.SHADES) - 1
+        lines = ["   " + " ".join(str(i) for i in range(self.size))]
+
+        for row in range(self.size):
+            start = row * self.size
+            row_display = [self.SHADES[counts[index] * top // peak]
+                           for index in range(start, start + self.size)]
+            lines.append(f"{row} |" + " ".join(row_display) + "|")
+        return "\n".join(lines)
+
+
+def simulated_games(
+    games: int,
+    board_size: int = 6,
+    shooter_factory: Callable[..., Player] = AIPlayer,
+    placer_factory: Callable[..., Player] = AIPlayer,
+    seed: int = 0,
+    first: int = 0
+) -> Iterator[Iterator[Shot]]:
+    """
+    Поток партий без интерфейса.
+
+    Партия N серии зависит только от (seed, N), поэтому ее можно
+    повторить отдельно: simulated_games(1, seed=seed, first=N).
+
+    Args:
+        games: Количество партий
+        board_size: Размер доски
+        shooter_factory: Функция, создающая стрелка по аргументу rng
+        placer_factory: Функция, создающая расставляющего по аргументу rng
+        seed: Зерно серии
+        first: Номер первой партии в серии
+
+    Yields:
+        Iterator[Shot]: Выстрелы очередной партии
+    """
+    for game in range(first, first + games):
+        board = Board(board_size)
+        placer_factory(rng=spawn_rng(seed, game, "placer")).place_ships(board)
+        yield simulate_shots(
+            shooter_factory(rng=spawn_rng(seed, game, "shooter")), board
+        )
+
+
+def save_game_log(path: str, games: Iterable[Iterable[Shot]]) -> None:
+    """
+    Запись партий в лог (одна партия на строку).
+
+    Формат строки: "строка,столбец,h|m|i" через пробел (i - некорректный
+    выстрел внешнего бота).
+
+    Args:
+        path: Путь к файлу
+        games: Партии для записи
+    """
+    with open(path, "a", encoding="utf-8") as file:
+        for shots in games:
+            file.write(" ".join(f"{row},{col},{result[0]}"
+                                for row, col, result in shots) + "\n")
+
+
+def read_game_log(path: str) -> Iterator[List[Shot]]:
+    """
+    Чтение партий из лога по одной (пустые строки пропускаются).
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        List[Shot]: Выстрелы очередной партии
+    """
+    results = {"h": "hit", "m": "miss", "i": "invalid"}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            shots = []
+            for token in line.split():
+                row, col, result = token.split(",")
+                shots.append((int(row), int(col), results[result]))
+            yield shots
+
+
+def main() -> None:
+    """Сбор статистики из командной строки."""
+    parser = argparse.ArgumentParser(
+        description="Тепловые карты выстрелов ИИ"
+    )
+    parser.add_argument("--size", type=int, default=6)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--log", default=None,
+                        help="Читать партии из лога вместо симуляции")
+    parser.add_argument("--csv", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--first", type=int, default=0,
+                        help="Номер первой партии серии")
+    args = parser.parse_args()
+
+    heatmap = ShotHeatmap(args.size)
+    if args.log:
+        heatmap.consume(read_game_log(args.log))
+    else:
+        seed = args.seed if args.seed is not None else new_seed()
+        print(f"Зерно серии: {seed}")
+        heatmap.consume(simulated_games(args.games, args.size,
+                                        seed=seed, first=args.first))
+
+    print(f"Партий: {heatmap.games}")
+    print("\nПопадания:")
+    print(heatmap.render(heatmap.hits))
+    print("\nПромахи:")
+    print(heatmap.render(heatmap.misses))
+    print("\nПервые попадания:")
+    print(heatmap.render(heatmap.first_hits))
+
+    if args.csv:
+        heatmap.save_csv(args.csv)
+
+
+if __name__ == "__main__":
+    main()
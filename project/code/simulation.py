@@ -0,0 +1,124 @@
+"""Модуль для игры без интерфейса (симуляции партий)."""
+from typing import Iterator, Optional, Tuple
+
+from board import (
+    Board,
+    BoardView,
+    FogOfWarView,
+    )
+from player import (
+    Player,
+    )
+
+
+def play_shot(shooter: Player, enemy_board: Board,
+              enemy_view: BoardView) -> Tuple[int, int, str]:
+    """
+    Один выстрел игрока по доске без вывода в консоль.
+
+    Args:
+        shooter: Стреляющий игрок
+        enemy_board: Доска противника
+        enemy_view: Доска противника в том виде, в котором ее видит игрок
+            (создается один раз на доску, обычно FogOfWarView)
+
+    Returns:
+        Tuple[int, int, str]: Координаты выстрела и его результат
+    """
+    row, col = shooter.make_shot(enemy_view)
+    result = enemy_board.make_shot(row, col)
+
+    if result == "hit":
+        shooter.register_hit()
+    # О некорректном выстреле игрок тоже узнает, иначе он молча теряет ход
+    shooter.register_result(row, col, result)
+    return row, col, result
+
+
+def simulate_shots(
+    shooter: Player,
+    enemy_board: Board,
+    max_shots: Optional[int] = None
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Выстрелы игрока по доске до уничтожения всех кораблей.
+
+    Args:
+        shooter: Стреляющий игрок
+        enemy_board: Доска противника с расставленными кораблями
+        max_shots: Предел выстрелов (None - по числу клеток доски)
+
+    Yields:
+        Tuple[int, int, str]: Координаты выстрела и его результат
+    """
+    limit = max_shots if max_shots is not None else enemy_board.size ** 2
+    ships_total = enemy_board.count_ships()
+    enemy_view = FogOfWarView(enemy_board)
+    shots = 0
+
+    while enemy_board.ships_hit < ships_total and shots < limit:
+        yield play_shot(shooter, enemy_board, enemy_view)
+        shots += 1
+
+
+def count_shots_to_win(
+    shooter: Player,
+    enemy_board: Board,
+    max_shots: Optional[int] = None
+) -> int:
+    """
+    Подсчет выстрелов, нужных игроку для уничтожения всех кораблей.
+
+    Args:
+        shooter: Стреляющий игрок
+        enemy_board: Доска противника с расставленными кораблями
+        max_shots: Предел выстрелов (None - по числу клеток доски)
+
+    Returns:
+        int: Количество сделанных выстрелов
+    """
+    return sum(1 for _ in simulate_shots(shooter, enemy_board, max_shots))
+
+
+def play_game(first: Player, second: Player, board_size: int = 6,
+              max_shots: Optional[int] = None) -> int:
+    """
+    Партия двух игроков без вывода в консоль.
+
+    Правила как в Game: после попадания игрок стреляет снова.
+    Некорректный выстрел считается промахом (ход переходит).
+
+    Args:
+        first: Игрок, который ходит первым
+        second: Второй игрок
+        board_size: Размер досок
+        max_shots: Предел выстрелов (None - по 4 на клетку доски)
+
+    Returns:
+        int: Номер победителя (0 или 1) или -1, если предел исчерпан
+    """
+    players = [first, second]
+    boards = [Board(board_size), Board(board_size)]
+    views = [FogOfWarView(board) for board in boards]
+    for player, board in zip(players, boards):
+        player.place_ships(board)
+
+    totals = [board.count_ships() for board in boards]
+    limit = max_shots if max_shots is not None else 4 * board_size ** 2
+    current = 0
+
+    for _ in range(limit):
+        enemy = 1 - current
+        _, _, result = play_shot(players[current], boards[enemy],
+                                 views[enemy])
+        if boards[enemy].ships_hit >= totals[enemy]:
+            winner = current
+            break
+        if result != "hit":
+            current = enemy
+    else:
+        winner = -1
+
+    for index, player in enumerate(players):
+        player.finish_game(index == winner)
+    return winner
\ No newline at end of file
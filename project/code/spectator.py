@@ -0,0 +1,228 @@
+"""Модуль для режима наблюдения за игрой компьютера против компьютера."""
+import os
+import select
+import sys
+import time
+from typing import Optional
+
+from ai_player import (
+    AIPlayer,
+    )
+from board import (
+    Board,
+    FogOfWarView,
+    )
+from random_streams import (
+    new_seed,
+    spawn_rng,
+    )
+from simulation import (
+    play_shot,
+    )
+from viewport import (
+    Viewport,
+    )
+
+
+class Spectator:
+    """Класс для просмотра партии ИИ против ИИ с заданной частотой кадров.
+
+    Симуляция идет по собственным часам (shots_per_second), а экран
+    перерисовывается не чаще fps раз в секунду. Если вывод не успевает,
+    кадры пропускаются, а симуляция догоняет упущенные выстрелы.
+    """
+
+    # Очистка экрана escape-последовательностью (без запуска процесса)
+    CLEAR = "\033[H\033[J"
+
+    COMMANDS_HELP = ("Команды (+Enter): p - пауза/продолжить, "
+                     "s - один выстрел, e - в конец, q - выход")
+
+    def __init__(self, board_size: int = 6, fps: float = 4.0,
+                 shots_per_second: float = 2.0,
+                 seed: Optional[int] = None) -> None:
+        """
+        Инициализация режима наблюдения.
+
+        Args:
+            board_size: Размер досок
+            fps: Максимальная частота перерисовки экрана
+            shots_per_second: Скорость симуляции
+            seed: Зерно партии (None - случайное)
+        """
+        self.board_size = board_size
+        self.frame_interval = 1 / fps
+        self.shot_interval = 1 / shots_per_second
+        self.seed = seed if seed is not None else new_seed()
+
+        self.players = [AIPlayer(rng=spawn_rng(self.seed, "player", index))
+                        for index in range(2)]
+        self.boards = [Board(board_size), Board(board_size)]
+        self.views = [FogOfWarView(board) for board in self.boards]
+        # Большие доски выводятся окном вокруг последнего выстрела
+        self.viewports = [Viewport(), Viewport()]
+        for index, player in enumerate(self.players, start=1):
+            player.name = f"Компьютер {index}"
+
+        self.current = 0
+        self.shots = 0
+        self.frames = 0
+        self.paused = False
+        self.last_event = ""
+        # Ввод закрыт (EOF): команд больше не будет, stdin не опрашиваем
+        self.input_closed = False
+
+        if os.name == "nt":
+            # Включает поддержку escape-последовательностей в консоли Windows
+            os.system("")
+
+    def setup(self) -> None:
+        """Расстановка кораблей обоих компьютеров."""
+        for player, board in zip(self.players, self.boards):
+            player.place_ships(board)
+
+    def is_over(self) -> bool:
+        """Проверка окончания партии.
+
+        Returns:
+            bool: True если у одного из игроков не осталось кораблей
+        """
+        return any(board.count_ships() == 0 for board in self.boards)
+
+    def step(self) -> None:
+        """Один выстрел текущего игрока (без вывода на экран)."""
+        shooter = self.players[self.current]
+        enemy = 1 - self.current
+        row, col, result = play_shot(shooter, self.boards[enemy],
+                                     self.views[enemy])
+        if result != "invalid":
+            self.viewports[enemy].record_shot(row, col, result,
+                                              self.board_size)
+            self.viewports[enemy].center_on(row, col, self.board_size)
+        self.shots += 1
+
+        outcome = "попал" if result == "hit" else "промахнулся"
+        self.last_event = f"{shooter.name} стреляет в [{row}, {col}]: {outcome}"
+
+        # При попадании игрок стреляет снова
+        if result != "hit":
+            self.current = 1 - self.current
+
+    def render(self) -> None:
+        """Перерисовка экрана одной записью в консоль."""
+        lines = [
+            "=" * 60,
+            "НАБЛЮДЕНИЕ: КОМПЬЮТЕР ПРОТИВ КОМПЬЮТЕРА".center(60),
+            "=" * 60,
+        ]
+        for player in self.players:
+            lines.append(f"{player.name}: {player.get_score()} попаданий")
+        for player, board, viewport in zip(self.players, self.boards,
+                                           self.viewports):
+            lines.append(f"\nДОСКА {player.name}:")
+            lines.append(viewport.render_board(board, show_ships=True))
+
+        status = "ПАУЗА" if self.paused else "игра идет"
+        lines.append(f"\nВыстрелов: {self.shots}, кадров: {self.frames} "
+                     f"({status})")
+        lines.append(self.last_event)
+        lines.append(self.COMMANDS_HELP)
+
+        sys.stdout.write(self.CLEAR + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self.frames += 1
+
+    def run(self) -> None:
+        """Основной цикл наблюдения."""
+        self.setup()
+        now = time.monotonic()
+        next_shot = now
+        next_frame = now
+        dirty = True
+
+        while not self.is_over():
+            # Ждем ввода до ближайшего выстрела или кадра
+            deadlines = []
+            if dirty:
+                deadlines.append(next_frame)
+            if not self.paused:
+                deadlines.append(next_shot)
+            wait = max(0.0, min(deadlines) - now) if deadlines else None
+
+            command = self._read_command(wait)
+            now = time.monotonic()
+
+            if command == "q":
+                return
+            if command == "p":
+                self.paused = not self.paused
+                next_shot = now
+                dirty = True
+            elif command == "s":
+                self.paused = True
+                self.step()
+                dirty = True
+            elif command == "e":
+                while not self.is_over():
+                    self.step()
+                break
+
+            # Симуляция догоняет свои часы независимо от скорости вывода
+            while not self.paused and now >= next_shot and not self.is_over():
+                self.step()
+                next_shot += self.shot_interval
+                dirty = True
+
+            if dirty and now >= next_frame:
+                self.render()
+                next_frame = now + self.frame_interval
+                dirty = False
+
+        self.show_results()
+
+    def show_results(self) -> None:
+        """Финальный кадр и итог партии."""
+        self.paused = False
+        self.render()
+        winner = (self.players[0] if self.boards[1].count_ships() == 0
+                  else self.players[1])
+        print(f"\n{winner.name} ВЫИГРАЛ за {self.shots} выстрелов!")
+        print(f"Зерно партии: {self.seed}")
+
+    def _read_command(self, timeout: Optional[float]) -> Optional[str]:
+        """
+        Ожидание команды с клавиатуры не дольше timeout секунд.
+
+        Args:
+            timeout: Время ожидания в секундах (None - ждать без ограничения)
+
+        Returns:
+            Optional[str]: Первая буква команды или None
+        """
+        if os.name == "nt":
+            import msvcrt
+
+            start = time.monotonic()
+            while True:
+                if msvcrt.kbhit():
+                    return msvcrt.getwch().lower()
+                if timeout is not None and time.monotonic() - start >= timeout:
+                    return None
+                time.sleep(0.01)
+
+        if self.input_closed:
+            # select на закрытом вводе всегда готов - просто ждем срока
+            if timeout:
+                time.sleep(timeout)
+            return None
+
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if not ready:
+            return None
+        line = sys.stdin.readline()
+        if not line:
+            # Без ввода паузу уже не снять, поэтому партия доигрывается
+            self.input_closed = True
+            self.paused = False
+            return None
+        return line.strip().lower()[:1] or None
@@ -0,0 +1,72 @@
+"""Тесты журнала выстрелов доски: отмена, отметки и откат."""
+import copy
+import unittest
+
+from board import Board
+
+
+class BoardJournalTest(unittest.TestCase):
+    """Проверка apply_shot, undo, checkpoint и rollback."""
+
+    def setUp(self) -> None:
+        self.board = Board(6)
+        self.assertTrue(self.board.place_ship(0, 0, 3, True))
+        self.assertTrue(self.board.place_ship(3, 3, 2, False))
+
+    def snapshot(self):
+        return copy.deepcopy(self.board.grid), self.board.ships_hit
+
+    def test_undo_restores_hit_and_miss(self) -> None:
+        before = self.snapshot()
+        self.assertEqual(self.board.apply_shot(0, 1), "hit")
+        self.assertEqual(self.board.apply_shot(5, 5), "miss")
+        self.assertEqual(self.board.ships_hit, 1)
+
+        self.assertTrue(self.board.undo())
+        self.assertEqual(self.board.grid[5][5], Board.WATER)
+        self.assertTrue(self.board.undo())
+        self.assertEqual(self.snapshot(), before)
+        self.assertFalse(self.board.undo())
+
+    def test_nested_checkpoints(self) -> None:
+        start = self.snapshot()
+        outer = self.board.checkpoint()
+        self.board.apply_shot(0, 0)
+        self.board.apply_shot(2, 2)
+        middle = self.snapshot()
+
+        inner = self.board.checkpoint()
+        self.board.apply_shot(3, 3)
+        self.board.apply_shot(4, 3)
+        self.board.apply_shot(1, 5)
+        self.assertEqual(self.board.ships_hit, 3)
+
+        self.board.rollback(inner)
+        self.assertEqual(self.snapshot(), middle)
+        self.assertEqual(self.board.ships_hit, 1)
+
+        self.board.apply_shot(0, 1)
+        self.board.rollback(outer)
+        self.assertEqual(self.snapshot(), start)
+        self.assertEqual(self.board.journal, [])
+
+    def test_invalid_shot_not_recorded(self) -> None:
+        self.board.apply_shot(0, 0)
+        mark = self.board.checkpoint()
+        after_hit = self.snapshot()
+
+        self.assertEqual(self.board.apply_shot(0, 0), "invalid")
+        self.assertEqual(self.board.apply_shot(-1, 2), "invalid")
+        self.assertEqual(self.board.apply_shot(2, 6), "invalid")
+        self.assertEqual(self.board.checkpoint(), mark)
+        self.assertEqual(self.snapshot(), after_hit)
+
+        self.board.rollback(mark)
+        self.assertEqual(self.snapshot(), after_hit)
+        self.assertTrue(self.board.undo())
+        self.assertEqual(self.board.grid[0][0], Board.SHIP)
+        self.assertEqual(self.board.ships_hit, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
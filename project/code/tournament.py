@@ -0,0 +1,121 @@
+"""Модуль для турнира между ИИ и внешними ботами."""
+import argparse
+import shlex
+from itertools import combinations
+from typing import Callable, Dict, List
+
+from ai_player import (
+    AIPlayer,
+    )
+from bot_player import (
+    BotError,
+    BotPlayer,
+    BotProcess,
+    )
+from player import (
+    Player,
+    )
+from simulation import (
+    play_game,
+    )
+
+
+def run_tournament(
+    entrants: Dict[str, Callable[[], Player]],
+    games: int,
+    board_size: int = 6
+) -> Dict[str, Dict[str, int]]:
+    """
+    Круговой турнир без вывода партий в консоль.
+
+    Каждая пара играет games партий, первый ход чередуется. Игрок,
+    из-за ошибки которого партия прервалась (BotError), проигрывает.
+    Если виновник ошибки неизвестен, партия считается прерванной
+    и не дает очков никому.
+
+    Args:
+        entrants: Имена участников и функции, создающие игрока на партию
+        games: Количество партий для каждой пары
+        board_size: Размер досок
+
+    Returns:
+        Dict[str, Dict[str, int]]: Победы, поражения, ничьи, ошибки
+        и прерванные партии
+    """
+    table = {name: {"wins": 0, "losses": 0, "draws": 0, "errors": 0,
+                    "aborted": 0}
+             for name in entrants}
+
+    for first_name, second_name in combinations(entrants, 2):
+        for game in range(games):
+            names = ([first_name, second_name] if game % 2 == 0
+                     else [second_name, first_name])
+            players = [entrants[name]() for name in names]
+            for name, player in zip(names, players):
+                player.name = name
+
+            try:
+                winner = play_game(players[0], players[1], board_size)
+            except BotError as error:
+                if error.player not in names:
+                    for name in names:
+                        table[name]["aborted"] += 1
+                    continue
+                table[error.player]["errors"] += 1
+                winner = 1 - names.index(error.player)
+
+            if winner == -1:
+                for name in names:
+                    table[name]["draws"] += 1
+                continue
+            table[names[winner]]["wins"] += 1
+            table[names[1 - winner]]["losses"] += 1
+
+    return table
+
+
+def print_table(table: Dict[str, Dict[str, int]]) -> None:
+    """
+    Вывод турнирной таблицы.
+
+    Args:
+        table: Результаты run_tournament
+    """
+    print(f"{'Участник':<20}{'Победы':>8}{'Поражения':>11}"
+          f"{'Ничьи':>7}{'Ошибки':>8}{'Прервано':>10}")
+    for name, row in sorted(table.items(), key=lambda item: -item[1]["wins"]):
+        print(f"{name:<20}{row['wins']:>8}{row['losses']:>11}"
+              f"{row['draws']:>7}{row['errors']:>8}{row['aborted']:>10}")
+
+
+def main() -> None:
+    """Запуск турнира из командной строки."""
+    parser = argparse.ArgumentParser(description="Турнир ботов")
+    parser.add_argument("--bot", action="append", default=[],
+                        metavar="ИМЯ=КОМАНДА",
+                        help="Внешний бот, например: rnd='python random_bot.py'")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument("--size", type=int, default=6)
+    args = parser.parse_args()
+
+    processes: List[BotProcess] = []
+    entrants: Dict[str, Callable[[], Player]] = {"AIPlayer": AIPlayer}
+
+    for spec in args.bot:
+        name, command = spec.split("=", 1)
+        # Один процесс на бота на весь турнир
+        process = BotProcess(shlex.split(command), args.timeout)
+        processes.append(process)
+        entrants[name] = (lambda process=process, name=name:
+                          BotPlayer(process, name))
+
+    try:
+        print_table(run_tournament(entrants, args.games, args.size))
+    finally:
+        for process in processes:
+            process.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Модуль для подбора параметров ИИ методом кросс-энтропии."""
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations, repeat
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_params import (
+    AIParams,
+    )
+from ai_player import (
+    AIPlayer,
+    )
+from board import (
+    Board,
+    )
+from random_streams import (
+    spawn_rng,
+    )
+from simulation import (
+    count_shots_to_win,
+    )
+
+# Все порядки четырех направлений добивания
+DIRECTION_ORDERS = [list(order) for order in
+                    permutations([(0, 1), (1, 0), (0, -1), (-1, 0)])]
+
+
+def evaluate_params(params_data: Dict[str, Any], seeds: List[int],
+                    board_size: int = 6) -> float:
+    """
+    Среднее число выстрелов до победы для набора параметров.
+
+    Расстановка и стрелок каждой партии получают свои потоки из зерна
+    партии, поэтому все кандидаты поколения играют на одинаковых
+    расстановках, а результат не зависит от процесса-исполнителя.
+
+    Args:
+        params_data: Параметры ИИ в виде словаря
+        seeds: Зерна случайных чисел для партий
+        board_size: Размер доски
+
+    Returns:
+        float: Среднее количество выстрелов
+    """
+    params = AIParams.from_dict(params_data)
+    total = 0
+
+    for seed in seeds:
+        board = Board(board_size)
+        AIPlayer(params=params,
+                 rng=spawn_rng(seed, "placer")).place_ships(board)
+        total += count_shots_to_win(
+            AIPlayer(params=params, rng=spawn_rng(seed, "shooter")), board
+        )
+    return total / len(seeds)
+
+
+class ParameterTuner:
+    """Класс для подбора параметров ИИ в самоигре.
+
+    Распределение параметров: категориальное для порядка направлений
+    и правила промаха, нормальное для веса четности (в логарифмах)
+    и порога эндшпиля. На каждом поколении распределение сдвигается
+    к лучшей доле кандидатов. После каждого поколения состояние
+    сохраняется в файл, и прерванный подбор продолжается с него.
+
+    Оценки поколения шумные: у каждого поколения свои партии, и лучший
+    из многих кандидатов часто лишь удачлив. Поэтому лучшие кандидаты
+    переоцениваются на постоянном наборе проверочных партий, и рекорд
+    (и файл параметров) обновляется только по проверочной оценке.
+    """
+
+    # Параметры, от которых зависят оценки: при их изменении продолжать
+    # подбор с сохранения нельзя
+    CHECKPOINT_SETTINGS = ("board_size", "population", "games",
+                           "validation_games")
+
+    def __init__(
+        self,
+        board_size: int = 6,
+        population: int = 24,
+        elite_fraction: float = 0.25,
+        games: int = 40,
+        validation_games: int = 200,
+        workers: Optional[int] = None,
+        checkpoint_path: str = "tuner_checkpoint.json",
+        output_path: str = AIParams.DEFAULT_FILE,
+        seed: int = 0,
+        smoothing: float = 0.7
+    ) -> None:
+        """
+        Инициализация подбора.
+
+        Args:
+            board_size: Размер доски
+            population: Количество кандидатов в поколении
+            elite_fraction: Доля лучших кандидатов для обновления
+            games: Количество партий на оценку кандидата
+            validation_games: Количество проверочных партий для лучших
+            workers: Количество процессов (None - по числу ядер)
+            checkpoint_path: Файл для сохранения состояния
+            output_path: Файл для лучших параметров
+            seed: Начальное зерно всего подбора
+            smoothing: Доля нового распределения при обновлении
+        """
+        self.board_size = board_size
+        self.population = population
+        self.elite_count = max(1, int(population * elite_fraction))
+        self.games = games
+        self.validation_games = validation_games
+        self.workers = workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.output_path = output_path
+        self.seed = seed
+        self.smoothing = smoothing
+
+        self.generation = 0
+        self.distribution = self._initial_distribution()
+        self.best_score = math.inf
+        self.best_params: Optional[Dict[str, Any]] = None
+
+    def _initial_distribution(self) -> Dict[str, Any]:
+        """Распределение до начала подбора.
+
+        Returns:
+            Dict[str, Any]: Параметры распределения
+        """
+        defaults = AIParams()
+        return {
+            "directions": [1 / len(DIRECTION_ORDERS)] * len(DIRECTION_ORDERS),
+            "miss_policy": [1 / len(AIParams.MISS_POLICIES)] * len(
+                AIParams.MISS_POLICIES),
+            "log_parity": [0.0, 0.7],
+            "endgame_limit": [float(defaults.endgame_limit), 15.0],
+        }
+
+    def run(self, generations: int) -> Tuple[float, Dict[str, Any]]:
+        """
+        Подбор параметров.
+
+        Args:
+            generations: Общее число поколений (с учетом уже пройденных)
+
+        Returns:
+            Tuple[float, Dict[str, Any]]: Лучшая проверочная оценка
+            и параметры
+        """
+        self._load_checkpoint()
+        # Проверочные партии одни и те же во всех поколениях
+        validation_rng = spawn_rng(self.seed, "validation")
+        validation_seeds = [validation_rng.randrange(2 ** 32)
+                            for _ in range(self.validation_games)]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while self.generation < generations:
+                # Случайность поколения зависит только от его номера,
+                # поэтому продолжение с сохранения повторяет ход подбора
+                rng = spawn_rng(self.seed, self.generation)
+                candidates = [self._sample(rng)
+                              for _ in range(self.population)]
+                seeds = [rng.randrange(2 ** 32) for _ in range(self.games)]
+
+                scores = list(pool.map(evaluate_params, candidates,
+                                       repeat(seeds),
+                                       repeat(self.board_size)))
+
+                ranked = sorted(zip(scores, candidates),
+                                key=lambda item: item[0])
+                elites = [params for _, params in ranked[:self.elite_count]]
+
+                validated = list(pool.map(evaluate_params, elites,
+                                          repeat(validation_seeds),
+                                          repeat(self.board_size)))
+                score, params = min(zip(validated, elites),
+                                    key=lambda item: item[0])
+                if score < self.best_score:
+                    self.best_score, self.best_params = score, params
+                    AIParams.from_dict(self.best_params).save(
+                        self.output_path)
+
+                self._update(elites)
+                self.generation += 1
+                self._save_checkpoint()
+
+                print(f"Поколение {self.generation}: лучшее "
+                      f"{ranked[0][0]:.2f}, среднее "
+                      f"{sum(scores) / len(scores):.2f}, проверка "
+                      f"{score:.2f}, рекорд {self.best_score:.2f}")
+
+        return self.best_score, self.best_params or AIParams().to_dict()
+
+    def _sample(self, rng: random.Random) -> Dict[str, Any]:
+        """
+        Случайный кандидат из текущего распределения.
+
+        Args:
+            rng: Генератор случайных чисел поколения
+
+        Returns:
+            Dict[str, Any]: Параметры кандидата
+        """
+        dist = self.distribution
+        directions = rng.choices(DIRECTION_ORDERS,
+                                 weights=dist["directions"])[0]
+        miss_policy = rng.choices(AIParams.MISS_POLICIES,
+                                  weights=dist["miss_policy"])[0]
+        log_parity = rng.gauss(*dist["log_parity"])
+        endgame_limit = rng.gauss(*dist["endgame_limit"])
+
+        return AIParams(
+            directions=directions,
+            miss_policy=miss_policy,
+            parity_weight=round(math.exp(log_parity), 3),
+            endgame_limit=max(0, min(80, round(endgame_limit)))
+        ).to_dict()
+
+    def _update(self, elites: List[Dict[str, Any]]) -> None:
+        """
+        Сдвиг распределения к лучшим кандидатам.
+
+        Args:
+            elites: Параметры лучших кандидатов
+        """
+        dist = self.distribution
+        keep = 1 - self.smoothing
+
+        def categorical(old: List[float], chosen: List[int]) -> List[float]:
+            counts = [chosen.count(index) / len(chosen)
+                      for index in range(len(old))]
+            return [keep * p + self.smoothing * q
+                    for p, q in zip(old, counts)]
+
+        def normal(old: List[float], values: List[float],
+                   min_std: float) -> List[float]:
+            mean = sum(values) / len(values)
+            std = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+            return [keep * old[0] + self.smoothing * mean,
+                    max(min_std, keep * old[1] + self.smoothing * std)]
+
+        orders = [[tuple(d) for d in order] for order in DIRECTION_ORDERS]
+        dist["directions"] = categorical(
+            dist["directions"],
+            [orders.index([tuple(d) for d in params["directions"]])
+             for params in elites]
+        )
+        dist["miss_policy"] = categorical(
+            dist["miss_policy"],
+            [AIParams.MISS_POLICIES.index(params["miss_policy"])
+             for params in elites]
+        )
+        dist["log_parity"] = normal(
+            dist["log_parity"],
+            [math.log(params["parity_weight"]) for params in elites], 0.05
+        )
+        dist["endgame_limit"] = normal(
+            dist["endgame_limit"],
+            [params["endgame_limit"] for params in elites], 1.0
+        )
+
+    def _save_checkpoint(self) -> None:
+        """Сохранение состояния подбора (запись через временный файл)."""
+        data = {
+            "settings": {name: getattr(self, name)
+                         for name in self.CHECKPOINT_SETTINGS},
+            "seed": self.seed,
+            "generation": self.generation,
+            "distribution": self.distribution,
+            "best_score": self.best_score,
+            "best_params": self.best_params,
+        }
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _load_checkpoint(self) -> None:
+        """Продолжение подбора с сохраненного состояния, если оно есть."""
+        if not os.path.exists(self.checkpoint_path):
+            return
+
+        with open(self.checkpoint_path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        settings = {name: getattr(self, name)
+                    for name in self.CHECKPOINT_SETTINGS}
+        if data.get("settings") != settings:
+            raise ValueError(
+                f"Сохранение {self.checkpoint_path} сделано с другими "
+                f"настройками ({data.get('settings')}, сейчас {settings}); "
+                f"удалите его или укажите другой --checkpoint"
+            )
+
+        self.seed = data["seed"]
+        self.generation = data["generation"]
+        self.distribution = data["distribution"]
+        self.best_score = data["best_score"]
+        self.best_params = data["best_params"]
+        print(f"Продолжаем с поколения {self.generation}")
+
+
+def main() -> None:
+    """Запуск подбора из командной строки."""
+    parser = argparse.ArgumentParser(description="Подбор параметров ИИ")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population", type=int, default=24)
+    parser.add_argument("--size", type=int, default=6)
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--validation", type=int, default=200,
+                        help="Проверочных партий для лучших кандидатов")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default="tuner_checkpoint.json")
+    parser.add_argument("--output", default=AIParams.DEFAULT_FILE)
+    args = parser.parse_args()
+
+    tuner = ParameterTuner(
+        board_size=args.size,
+        population=args.population,
+        games=args.games,
+        validation_games=args.validation,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        output_path=args.output,
+        seed=args.seed
+    )
+    try:
+        score, params = tuner.run(args.generations)
+    except ValueError as error:
+        print(error)
+        return
+    print(f"\nЛучший результат: {score:.2f} выстрелов")
+    print(json.dumps(params, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Модуль для вывода больших досок окном и мини-картой."""
+from array import array
+from typing import List
+
+from board import (
+    Board,
+    BoardView,
+    )
+
+
+class Viewport:
+    """Класс для вывода части доски, которая помещается в консоль.
+
+    Читаются только клетки окна, а мини-карта строится по счетчикам
+    попаданий и промахов в блоках доски, которые обновляются при каждом
+    выстреле (record_shot). Поэтому время вывода не зависит от размера
+    доски.
+    """
+
+    # Обозначение окна на мини-карте
+    FRAME = "#"
+
+    def __init__(self, rows: int = 20, cols: int = 20,
+                 minimap_size: int = 16) -> None:
+        """
+        Инициализация окна.
+
+        Args:
+            rows: Высота окна в клетках
+            cols: Ширина окна в клетках
+            minimap_size: Наибольшая сторона мини-карты в клетках
+        """
+        self.rows = rows
+        self.cols = cols
+        self.minimap_size = minimap_size
+        self.top = 0
+        self.left = 0
+        # Счетчики по блокам мини-карты (строка блока * сторону + столбец)
+        self.board_size = 0
+        self.block = 1
+        self.hits = array("l")
+        self.misses = array("l")
+
+    def record_shot(self, row: int, col: int, result: str,
+                    board_size: int) -> None:
+        """
+        Учет выстрела в счетчиках мини-карты.
+
+        Args:
+            row: Строка выстрела
+            col: Столбец выстрела
+            result: Результат выстрела ('hit' или 'miss')
+            board_size: Размер доски
+        """
+        if board_size != self.board_size:
+            self._reset_counters(board_size)
+
+        index = self._block_index(row, col)
+        if result == "hit":
+            self.hits[index] += 1
+        elif result == "miss":
+            self.misses[index] += 1
+
+    def _reset_counters(self, board_size: int) -> None:
+        """
+        Обнуление счетчиков под доску заданного размера.
+
+        Args:
+            board_size: Размер доски
+        """
+        self.board_size = board_size
+        self.block = -(-board_size // min(board_size, self.minimap_size))
+        blocks = self._minimap_side() ** 2
+        self.hits = array("l", [0] * blocks)
+        self.misses = array("l", [0] * blocks)
+
+    def _minimap_side(self) -> int:
+        """Количество блоков мини-карты по одной стороне.
+
+        Returns:
+            int: Сторона мини-карты в клетках
+        """
+        return -(-self.board_size // self.block)
+
+    def _block_index(self, row: int, col: int) -> int:
+        """
+        Номер блока мини-карты, в который попадает клетка доски.
+
+        Args:
+            row: Строка клетки
+            col: Столбец клетки
+
+        Returns:
+            int: Номер блока в счетчиках
+        """
+        return (row // self.block) * self._minimap_side() + col // self.block
+
+    def scroll(self, delta_rows: int, delta_cols: int, board_size: int) -> None:
+        """
+        Сдвиг окна.
+
+        Args:
+            delta_rows: Сдвиг по строкам
+            delta_cols: Сдвиг по столбцам
+            board_size: Размер доски
+        """
+        self.top = self._clamp(self.top + delta_rows, self.rows, board_size)
+        self.left = self._clamp(self.left + delta_cols, self.cols, board_size)
+
+    def center_on(self, row: int, col: int, board_size: int) -> None:
+        """
+        Сдвиг окна так, чтобы клетка оказалась в центре.
+
+        Args:
+            row: Строка клетки
+            col: Столбец клетки
+            board_size: Размер доски
+        """
+        self.top = self._clamp(row - self.rows // 2, self.rows, board_size)
+        self.left = self._clamp(col - self.cols // 2, self.cols, board_size)
+
+    def _clamp(self, start: int, length: int, board_size: int) -> int:
+        """
+        Ограничение начала окна границами доски.
+
+        Args:
+            start: Желаемое начало окна
+            length: Длина окна
+            board_size: Размер доски
+
+        Returns:
+            int: Допустимое начало окна
+        """
+        return max(0, min(start, board_size - length))
+
+    def render_board(self, board: BoardView,
+                     show_ships: bool = False) -> str:
+        """
+        Доска целиком, если помещается в окно, иначе окно и мини-карта.
+
+        Args:
+            board: Доска или ее представление с туманом войны
+            show_ships: Показывать ли корабли
+
+        Returns:
+            str: Текст для вывода в консоль
+        """
+        if board.size <= self.rows and board.size <= self.cols:
+            return board.render(show_ships)
+
+        return "\n".join([self.render(board, show_ships), "Мини-карта:",
+                          self.render_minimap(board, show_ships)])
+
+    def render(self, board: BoardView, show_ships: bool = False) -> str:
+        """
+        Текстовое представление окна доски в стиле Board.display.
+
+        Args:
+            board: Доска или ее представление с туманом войны
+            show_ships: Показывать ли корабли
+
+        Returns:
+            str: Окно доски с номерами строк и столбцов
+        """
+        rows = range(self.top, min(self.top + self.rows, board.size))
+        cols = range(self.left, min(self.left + self.cols, board.size))
+        width = len(str(board.size - 1))
+
+        lines = [" " * (width + 2) +
+                 " ".join(str(col).rjust(width) for col in cols)]
+        for row in rows:
+            cells = board.grid[row]
+            row_display = []
+            for col in cols:
+                cell = cells[col]
+                if cell == Board.SHIP and not show_ships:
+                    cell = Board.WATER
+                row_display.append(cell.rjust(width))
+            lines.append(f"{str(row).rjust(width)} |" +
+                         " ".join(row_display) + "|")
+
+        lines.append(f"Строки {rows.start}-{rows.stop - 1}, "
+                     f"столбцы {cols.start}-{cols.stop - 1} "
+                     f"из {board.size}")
+        return "\n".join(lines)
+
+    def render_minimap(self, board: BoardView,
+                       show_ships: bool = False) -> str:
+        """
+        Уменьшенная карта всей доски с отмеченным окном.
+
+        Блок показывается как попадание, если в нем было попадание,
+        затем как корабль (при show_ships), затем как промах. Вода
+        в блоках, задетых окном, показана как FRAME.
+
+        Args:
+            board: Доска или ее представление с туманом войны
+            show_ships: Показывать ли корабли
+
+        Returns:
+            str: Мини-карта
+        """
+        if board.size != self.board_size:
+            self._reset_counters(board.size)
+        side = self._minimap_side()
+
+        ship_blocks = set()
+        # Расстановка известна только у настоящей доски, не у тумана войны
+        if show_ships and isinstance(board, Board):
+            for ship_row, ship_col, ship_size, horizontal in board.ships:
+                for offset in range(ship_size):
+                    ship_blocks.add(self._block_index(
+                        ship_row + (0 if horizontal else offset),
+                        ship_col + (offset if horizontal else 0)
+                    ))
+
+        lines: List[str] = []
+        for mini_row in range(side):
+            in_rows = self._overlaps(mini_row * self.block, self.block,
+                                     self.top, self.rows)
+            row_display = []
+            for mini_col in range(side):
+                index = mini_row * side + mini_col
+                if self.hits[index]:
+                    cell = Board.HIT
+                elif index in ship_blocks:
+                    cell = Board.SHIP
+                elif self.misses[index]:
+                    cell = Board.MISS
+                elif in_rows and self._overlaps(mini_col * self.block,
+                                                self.block, self.left,
+                                                self.cols):
+                    cell = self.FRAME
+                else:
+                    cell = Board.WATER
+                row_display.append(cell)
+            lines.append("|" + "".join(row_display) + "|")
+        return "\n".join(lines)
+
+    def _overlaps(self, start: int, length: int,
+                  window_start: int, window_length: int) -> bool:
+        """
+        Проверка пересечения блока доски с окном по одной оси.
+
+        Args:
+            start: Начало блока
+            length: Длина блока
+            window_start: Начало окна
+            window_length: Длина окна
+
+        Returns:
+            bool: True если блок и окно пересекаются
+        """
+        return (start < window_start + window_length and
+                window_start < start + length)